@@ -15,6 +15,8 @@ from .device import create_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNIQUE_ID_SUFFIX = "_run_once"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,7 +54,7 @@ class WLEDEffectRunOnceButton(CoordinatorEntity[EffectCoordinator], ButtonEntity
         """
         super().__init__(coordinator)
         
-        self._attr_unique_id = f"{entry.entry_id}_run_once"
+        self._attr_unique_id = entry.entry_id + _UNIQUE_ID_SUFFIX
         self._attr_name = "Run Once"
         
         # Set device info
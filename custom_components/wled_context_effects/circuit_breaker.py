@@ -1,10 +1,9 @@
 """Circuit breaker pattern for WLED command reliability."""
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Callable, TypeVar
 
 from .const import CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_TIMEOUT
@@ -15,12 +14,28 @@ _LOGGER = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
-class CircuitState(Enum):
+class CircuitState(IntEnum):
     """Circuit breaker states."""
 
-    CLOSED = "closed"  # Normal operation
-    OPEN = "open"  # Failing, reject requests
-    HALF_OPEN = "half_open"  # Testing if recovered
+    CLOSED = 0  # Normal operation
+    OPEN = 1  # Failing, reject requests
+    HALF_OPEN = 2  # Testing if recovered
+
+
+# Breaker events
+_EVENT_SUCCESS = "success"
+_EVENT_FAILURE = "failure"
+_EVENT_THRESHOLD = "threshold"  # Failure that reached the failure threshold
+_EVENT_TIMEOUT = "timeout"  # Recovery timeout elapsed
+
+# (state, event) -> new state; pairs not listed leave the state unchanged
+_TRANSITIONS: dict[tuple[CircuitState, str], CircuitState] = {
+    (CircuitState.CLOSED, _EVENT_THRESHOLD): CircuitState.OPEN,
+    (CircuitState.OPEN, _EVENT_TIMEOUT): CircuitState.HALF_OPEN,
+    (CircuitState.HALF_OPEN, _EVENT_SUCCESS): CircuitState.CLOSED,
+    (CircuitState.HALF_OPEN, _EVENT_FAILURE): CircuitState.OPEN,
+    (CircuitState.HALF_OPEN, _EVENT_THRESHOLD): CircuitState.OPEN,
+}
 
 
 class CircuitBreaker:
@@ -35,6 +50,18 @@ class CircuitBreaker:
     - HALF_OPEN: Testing recovery, limited requests allowed
     """
 
+    __slots__ = (
+        "failure_threshold",
+        "timeout",
+        "name",
+        "_timeout_ns",
+        "_state",
+        "_failure_count",
+        "_last_failure_time",
+        "_next_attempt_ns",
+        "_success_count",
+    )
+
     def __init__(
         self,
         failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
@@ -50,13 +77,16 @@ class CircuitBreaker:
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
+        self._timeout_ns = int(timeout * 1e9)
         self.name = name
 
         self._state = CircuitState.CLOSED
         self._failure_count = 0
+        # Wall-clock time of the last failure, for reporting only
         self._last_failure_time: float | None = None
+        # Monotonic time (ns) at which an OPEN circuit may try HALF_OPEN
+        self._next_attempt_ns = 0
         self._success_count = 0
-        self._lock = asyncio.Lock()
 
         _LOGGER.debug(
             "Circuit breaker '%s' initialized: threshold=%d, timeout=%.1fs",
@@ -85,28 +115,24 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Any exception raised by func
         """
-        async with self._lock:
-            # Check if we should attempt recovery
-            if self._state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    _LOGGER.info(
-                        "Circuit breaker '%s' entering HALF_OPEN state",
-                        self.name,
-                    )
-                    self._state = CircuitState.HALF_OPEN
-                else:
-                    raise CircuitBreakerOpenError(
-                        f"Circuit breaker '{self.name}' is OPEN"
-                    )
+        # State checks and transitions never await, so on the single-threaded
+        # event loop they are atomic and need no lock
+        if self._state == CircuitState.OPEN:
+            if self._should_attempt_reset():
+                self._transition(_EVENT_TIMEOUT)
+            else:
+                raise CircuitBreakerOpenError(
+                    f"Circuit breaker '{self.name}' is OPEN"
+                )
 
         # Execute the function
         try:
             result = await func(*args, **kwargs)
-            await self._on_success()
+            self._on_success()
             return result
 
-        except Exception as err:
-            await self._on_failure()
+        except Exception:
+            self._on_failure()
             raise
 
     def _should_attempt_reset(self) -> bool:
@@ -115,45 +141,59 @@ class CircuitBreaker:
         Returns:
             True if should attempt reset
         """
-        if self._last_failure_time is None:
+        return time.monotonic_ns() >= self._next_attempt_ns
+
+    def _transition(self, event: str) -> bool:
+        """Apply the state transition for an event, if any.
+
+        Args:
+            event: Breaker event name
+
+        Returns:
+            True if the state changed
+        """
+        new_state = _TRANSITIONS.get((self._state, event))
+        if new_state is None:
             return False
 
-        elapsed = time.time() - self._last_failure_time
-        return elapsed >= self.timeout
+        _LOGGER.log(
+            logging.WARNING if new_state == CircuitState.OPEN else logging.INFO,
+            "Circuit breaker '%s' %s -> %s on %s (%d failures)",
+            self.name,
+            self._state.name,
+            new_state.name,
+            event,
+            self._failure_count,
+        )
+        self._state = new_state
+        return True
 
-    async def _on_success(self) -> None:
+    def _on_success(self) -> None:
         """Handle successful call."""
-        async with self._lock:
-            self._success_count += 1
+        self._success_count += 1
 
-            if self._state == CircuitState.HALF_OPEN:
-                _LOGGER.info(
-                    "Circuit breaker '%s' recovered, entering CLOSED state",
-                    self.name,
-                )
-                self._state = CircuitState.CLOSED
-                self._failure_count = 0
+        # The only success transition is HALF_OPEN -> CLOSED
+        if self._transition(_EVENT_SUCCESS):
+            self._failure_count = 0
 
-    async def _on_failure(self) -> None:
+    def _on_failure(self) -> None:
         """Handle failed call."""
-        async with self._lock:
-            self._failure_count += 1
-            self._last_failure_time = time.time()
-
-            if self._state == CircuitState.HALF_OPEN:
-                _LOGGER.warning(
-                    "Circuit breaker '%s' failed during HALF_OPEN, returning to OPEN",
-                    self.name,
-                )
-                self._state = CircuitState.OPEN
-
-            elif self._failure_count >= self.failure_threshold:
-                _LOGGER.error(
-                    "Circuit breaker '%s' threshold reached (%d failures), entering OPEN state",
-                    self.name,
-                    self._failure_count,
-                )
-                self._state = CircuitState.OPEN
+        self._failure_count += 1
+
+        # While OPEN the recovery timeout stays anchored to the failure that
+        # opened the circuit, so late failures skip the clock read
+        if self._state == CircuitState.OPEN:
+            return
+        now = time.monotonic_ns()
+        self._last_failure_time = time.time()
+
+        if self._transition(
+            _EVENT_THRESHOLD
+            if self._failure_count >= self.failure_threshold
+            else _EVENT_FAILURE
+        ):
+            # Every failure transition opens the circuit
+            self._next_attempt_ns = now + self._timeout_ns
 
     @property
     def state(self) -> CircuitState:
@@ -182,11 +222,11 @@ class CircuitBreaker:
 
     async def reset(self) -> None:
         """Manually reset the circuit breaker."""
-        async with self._lock:
-            _LOGGER.info("Manually resetting circuit breaker '%s'", self.name)
-            self._state = CircuitState.CLOSED
-            self._failure_count = 0
-            self._last_failure_time = None
+        _LOGGER.info("Manually resetting circuit breaker '%s'", self.name)
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._last_failure_time = None
+        self._next_attempt_ns = 0
 
     def get_stats(self) -> dict[str, Any]:
         """Get circuit breaker statistics.
@@ -196,7 +236,7 @@ class CircuitBreaker:
         """
         return {
             "name": self.name,
-            "state": self._state.value,
+            "state": self._state.name.lower(),
             "failure_count": self._failure_count,
             "success_count": self._success_count,
             "last_failure_time": self._last_failure_time,
@@ -195,7 +195,7 @@ class WLEDEffectsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not errors:
                 # Get effect-specific config
                 effect_class = EFFECT_REGISTRY.get_effect_class(self._effect_type)
-                effect_schema = effect_class.config_schema()
+                effect_schema = effect_class.cached_config_schema()
                 
                 # Extract effect-specific fields
                 effect_config = {}
@@ -272,7 +272,7 @@ class WLEDEffectsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Add effect-specific fields
         try:
             effect_class = EFFECT_REGISTRY.get_effect_class(self._effect_type)
-            effect_schema = effect_class.config_schema()
+            effect_schema = effect_class.cached_config_schema()
             
             for key, value_schema in effect_schema.get("properties", {}).items():
                 # Skip common fields already added
@@ -434,7 +434,7 @@ class WLEDEffectsOptionsFlow(config_entries.OptionsFlow):
                 
                 try:
                     effect_class = EFFECT_REGISTRY.get_effect_class(effect_type)
-                    effect_schema = effect_class.config_schema()
+                    effect_schema = effect_class.cached_config_schema()
                     
                     for key, value_schema in effect_schema.get("properties", {}).items():
                         if key in user_input and key not in common_fields:
@@ -498,7 +498,7 @@ class WLEDEffectsOptionsFlow(config_entries.OptionsFlow):
         # Add effect-specific fields
         try:
             effect_class = EFFECT_REGISTRY.get_effect_class(effect_type)
-            effect_schema = effect_class.config_schema()
+            effect_schema = effect_class.cached_config_schema()
             effect_config = options.get(CONF_EFFECT_CONFIG, {})
             
             for key, value_schema in effect_schema.get("properties", {}).items():
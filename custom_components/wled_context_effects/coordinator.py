@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -11,11 +12,6 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
-    ATTR_COMMAND_COUNT,
-    ATTR_FAILURE_COUNT,
-    ATTR_LAST_ERROR,
-    ATTR_SUCCESS_COUNT,
-    ATTR_SUCCESS_RATE,
     DEFAULT_STATE_SOURCE_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     STATE_ERROR,
@@ -32,6 +28,17 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class EffectStatistics:
+    """Command statistics snapshot for an effect."""
+
+    command_count: int = 0
+    success_count: int = 0
+    failure_count: int = 0
+    success_rate: float = 100.0
+    last_error: str | None = None
+
+
 class EffectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinate effect state and execution.
     
@@ -62,6 +69,7 @@ class EffectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self._last_started: datetime | None = None
         self._last_stopped: datetime | None = None
+        self.statistics = EffectStatistics()
 
         _LOGGER.debug(
             "Effect coordinator initialized for %s",
@@ -75,18 +83,19 @@ class EffectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             Dict with effect state data
         """
         try:
+            # Typed statistics are read directly by entities as attributes
+            self.statistics = EffectStatistics(
+                command_count=self.effect.command_count,
+                success_count=self.effect.success_count,
+                failure_count=self.effect.failure_count,
+                success_rate=self.effect.success_rate,
+                last_error=self.effect.last_error,
+            )
             return {
                 "running": self.effect.running,
                 "effect_type": self.effect.get_effect_name(),
                 "last_updated": datetime.now(),
                 "last_error": self.effect.last_error,
-                "statistics": {
-                    ATTR_COMMAND_COUNT: self.effect.command_count,
-                    ATTR_SUCCESS_COUNT: self.effect.success_count,
-                    ATTR_FAILURE_COUNT: self.effect.failure_count,
-                    ATTR_SUCCESS_RATE: self.effect.success_rate,
-                    ATTR_LAST_ERROR: self.effect.last_error,
-                },
                 "state": self._get_state(),
                 "last_started": self._last_started,
                 "last_stopped": self._last_stopped,
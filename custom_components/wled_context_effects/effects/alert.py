@@ -426,18 +426,10 @@ class AlertEffect(WLEDEffectBase):
                 await self.set_individual_leds(colors)
             except Exception as err:
                 _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=config["color"],
-                )
+                await self.send_color(config["color"])
         else:
             # No JSON client - use basic command
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=config["color"],
-            )
+            await self.send_color(config["color"])
         
         # Advance phase
         self.phase += 0.03  # 30ms time step
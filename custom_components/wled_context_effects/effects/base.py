@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
 from abc import abstractmethod
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
@@ -21,7 +23,7 @@ from ..const import (
     TRANSITION_MODE_SMOOTH,
 )
 from ..data_mapper import DataMapper, MultiInputBlender, ValueSmoother
-from ..errors import EffectExecutionError
+from ..errors import ConnectionError as WLEDConnectionError, EffectExecutionError
 from ..trigger_manager import TriggerConfig, TriggerManager
 from ..wled_json_api import WLEDJsonApiClient
 
@@ -30,6 +32,34 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Solid colors closer than this (sum of channel differences) to the last one
+# sent are not re-sent
+_COLOR_CHANGE_THRESHOLD = 2
+
+# "R,G,B" color strings from effect configs
+_COLOR_RE = re.compile(r"\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*")
+
+
+@functools.lru_cache(maxsize=256)
+def parse_color(
+    color_str: str, default: tuple[int, int, int]
+) -> tuple[int, int, int]:
+    """Parse color from "R,G,B" string format, caching results across effects.
+
+    Each channel is clamped to 0-255.
+
+    Args:
+        color_str: Color in format "R,G,B"
+        default: Color returned if the string cannot be parsed
+
+    Returns:
+        RGB tuple
+    """
+    match = _COLOR_RE.fullmatch(color_str)
+    if match is None:
+        return default
+    return tuple(max(0, min(255, int(channel))) for channel in match.groups())
+
 
 @runtime_checkable
 class EffectProtocol(Protocol):
@@ -102,6 +132,8 @@ class WLEDEffectBase:
         self._success_count = 0
         self._failure_count = 0
         self._start_time: datetime | None = None
+        # Last solid color sent by send_color(), None when the device state is unknown
+        self._last_sent_color: tuple[int, int, int] | None = None
 
         # Extract common config
         self.segment_id: int = config.get("segment_id", DEFAULT_SEGMENT_ID)
@@ -180,6 +212,7 @@ class WLEDEffectBase:
         self._running = True
         self._start_time = datetime.now()
         self._last_error = None
+        self._last_sent_color = None
         self._task = self.hass.async_create_task(self._run_loop())
 
     async def stop(self) -> None:
@@ -270,6 +303,7 @@ class WLEDEffectBase:
             EffectExecutionError: If command fails
         """
         self._command_count += 1
+        self._last_sent_color = None
 
         try:
             # Add segment_id to kwargs if not present
@@ -282,6 +316,9 @@ class WLEDEffectBase:
                 kwargs,
             )
 
+            # Send queued JSON writes first so none lands after this command
+            if self.json_client is not None:
+                await self.json_client.flush()
             await self.wled.segment(**kwargs)
             self._success_count += 1
             return True
@@ -297,6 +334,58 @@ class WLEDEffectBase:
             self._failure_count += 1
             raise EffectExecutionError(f"WLED command data error: {err}") from err
 
+    async def send_color(self, color: tuple[int, int, int]) -> bool:
+        """Set the segment to a solid color, skipping near-identical repeats.
+
+        With a JSON API client the write is queued on the client, so solid
+        colors from all effects on the same device within one flush window
+        go out as a single request. The call returns once that request has
+        been sent, so failures are counted and raised like direct commands.
+
+        Args:
+            color: RGB color tuple
+
+        Returns:
+            True if a command was sent, False if it was skipped
+
+        Raises:
+            EffectExecutionError: If command fails
+        """
+        last = self._last_sent_color
+        if last is not None and (
+            abs(color[0] - last[0]) + abs(color[1] - last[1]) + abs(color[2] - last[2])
+            < _COLOR_CHANGE_THRESHOLD
+        ):
+            return False
+
+        if self.json_client is not None:
+            self._command_count += 1
+            try:
+                await self.json_client.queue_state({
+                    "seg": [{
+                        "id": self.segment_id,
+                        "on": True,
+                        "bri": self.brightness,
+                        "col": [list(color)],
+                    }],
+                })
+                await self.json_client.flush(immediate=False)
+            except WLEDConnectionError as err:
+                _LOGGER.error("WLED command connection error: %s", err)
+                self._last_error = str(err)
+                self._failure_count += 1
+                self._last_sent_color = None
+                raise EffectExecutionError(f"WLED command connection error: {err}") from err
+            self._success_count += 1
+        else:
+            await self.send_wled_command(
+                on=True,
+                brightness=self.brightness,
+                color_primary=color,
+            )
+        self._last_sent_color = color
+        return True
+
     async def set_individual_leds(
         self,
         colors: list[tuple[int, int, int]],
@@ -308,7 +397,7 @@ class WLEDEffectBase:
         Automatically handles batching for large LED arrays.
 
         Args:
-            colors: List of RGB tuples (one per LED)
+            colors: List of RGB tuples or an (N, 3) uint8 array (one row per LED)
             start_index: Starting LED index in segment (default 0)
 
         Returns:
@@ -324,6 +413,7 @@ class WLEDEffectBase:
             )
 
         self._command_count += 1
+        self._last_sent_color = None
 
         try:
             _LOGGER.debug(
@@ -374,6 +464,7 @@ class WLEDEffectBase:
             raise EffectExecutionError("JSON API client required for per-LED control")
 
         self._command_count += 1
+        self._last_sent_color = None
 
         try:
             await self.json_client.set_led(
@@ -419,6 +510,7 @@ class WLEDEffectBase:
             raise EffectExecutionError("JSON API client required for per-LED control")
 
         self._command_count += 1
+        self._last_sent_color = None
 
         try:
             await self.json_client.set_led_range(
@@ -455,6 +547,7 @@ class WLEDEffectBase:
             _LOGGER.debug("JSON API client not available, skipping clear")
             return True
 
+        self._last_sent_color = None
         try:
             await self.json_client.clear_individual_leds(self.segment_id)
             return True
@@ -509,13 +602,14 @@ class WLEDEffectBase:
         This allows effects to run in opposite direction.
 
         Args:
-            led_array: List of LED values (colors, brightness, etc.)
+            led_array: List or array of LED values (colors, brightness, etc.)
 
         Returns:
-            Reversed or original list based on config
+            Reversed or original sequence based on config; NumPy arrays are
+            reversed as a zero-copy view
         """
         if self.reverse_direction:
-            return list(reversed(led_array))
+            return led_array[::-1]
         return led_array
 
     def map_to_zone(self, zone_index: int) -> tuple[int, int]:
@@ -679,6 +773,22 @@ class WLEDEffectBase:
             return None
         return (datetime.now() - self._start_time).total_seconds()
 
+    @classmethod
+    def cached_config_schema(cls) -> dict[str, Any]:
+        """Return config_schema(), built once per effect class.
+
+        Schemas are static, so callers share one dict and must not modify it.
+
+        Returns:
+            JSON schema dict
+        """
+        # Look in the class's own namespace so subclasses never reuse a parent's schema
+        schema = cls.__dict__.get("_config_schema_cache")
+        if schema is None:
+            schema = cls.config_schema()
+            cls._config_schema_cache = schema
+        return schema
+
     @classmethod
     def config_schema(cls) -> dict[str, Any]:
         """Return config schema for effect.
@@ -796,6 +906,7 @@ class WLEDEffectBase:
         
         self.zone_count = self.config.get("zone_count", DEFAULT_ZONE_COUNT)
         self.reactive_inputs = self.config.get("reactive_inputs", [])
+        self._last_sent_color = None
         
         _LOGGER.debug(
             "Reloaded config for effect %s: brightness=%d, segment_id=%d",
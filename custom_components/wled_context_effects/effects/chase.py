@@ -232,18 +232,10 @@ class ChaseEffect(WLEDEffectBase):
                 await self.set_individual_leds(colors)
             except Exception as err:
                 _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=self.chase_color,
-                )
+                await self.send_color(self.chase_color)
         else:
             # No JSON client - use basic command
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=self.chase_color,
-            )
+            await self.send_color(self.chase_color)
         
         # Update position
         self.position += self.direction
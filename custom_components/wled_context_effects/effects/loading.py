@@ -5,8 +5,10 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from ..coordinator import StateSourceCoordinator
-from ..effects.base import WLEDEffectBase
+from ..effects.base import WLEDEffectBase, parse_color
 from ..effects.registry import register_effect
 
 if TYPE_CHECKING:
@@ -51,6 +53,7 @@ class LoadingEffect(WLEDEffectBase):
         self.bar_size: int = config.get("bar_size", 5)
         self.speed: float = config.get("speed", 0.03)
         self.trail_fade: bool = config.get("trail_fade", True)
+        self._color_arr = np.array(self.color, dtype=np.float64)
         
         # State-reactive configuration (optional)
         self.state_entity: str | None = config.get("state_entity")
@@ -62,13 +65,24 @@ class LoadingEffect(WLEDEffectBase):
         # Animation state
         self.position: int = 0
         self.direction: int = 1
+        # LED count of the segment, updated on setup and config reload
+        self._led_count: int = 0
         self.state_coordinator: StateSourceCoordinator | None = None
+        
+        # LED index vector, rebuilt when the LED count changes
+        self._idx: np.ndarray = np.arange(0)
+        # (position, bar_size, led_count) of the last frame sent per-LED
+        self._last_frame_key: tuple[int, int, int] | None = None
+        # Last frame the device is known to show, for sending only changes
+        self._prev_frame: np.ndarray | None = None
 
     async def setup(self) -> bool:
         """Setup effect with optional state coordinator."""
         if not await super().setup():
             return False
         
+        self._led_count = (self.stop_led - self.start_led) + 1
+        
         # Create state coordinator if entity specified
         if self.state_entity:
             self.state_coordinator = StateSourceCoordinator(
@@ -81,6 +95,12 @@ class LoadingEffect(WLEDEffectBase):
         
         return True
 
+    async def start(self) -> None:
+        """Start effect, always sending the first frame."""
+        self._last_frame_key = None
+        self._prev_frame = None
+        await super().start()
+
     async def stop(self) -> None:
         """Stop effect and cleanup state coordinator."""
         await super().stop()
@@ -114,23 +134,22 @@ class LoadingEffect(WLEDEffectBase):
         Returns:
             RGB tuple
         """
-        try:
-            parts = color_str.split(",")
-            return (int(parts[0]), int(parts[1]), int(parts[2]))
-        except (ValueError, IndexError):
-            return (0, 255, 0)  # Default to green
+        return parse_color(color_str, (0, 255, 0))  # Default to green
 
     async def run_effect(self) -> None:
         """Render loading bar animation."""
         # Check manual override
         if await self.check_manual_override():
+            # The device may be changed meanwhile, so resend in full afterwards
+            self._last_frame_key = None
+            self._prev_frame = None
             await asyncio.sleep(0.1)
             return
 
         # Get state value if configured
         state_value = self._get_state_value() if self.state_entity else None
         
-        led_count = (self.stop_led - self.start_led) + 1
+        led_count = self._led_count
         
         # Determine current position
         if state_value is not None and self.state_controls == "position":
@@ -148,49 +167,24 @@ class LoadingEffect(WLEDEffectBase):
                 state_value, 0.0, 1.0, 1.0, 50.0, smooth=True
             ))
         
-        # Calculate which LEDs should be lit
-        colors: list[tuple[int, int, int]] = []
-        
-        for i in range(led_count):
-            # Distance from current position
-            distance = abs(i - self.position)
-            
-            if distance < current_bar_size:
-                if self.trail_fade:
-                    # Fade based on distance
-                    fade_factor = 1.0 - (distance / current_bar_size)
-                    color = (
-                        int(self.color[0] * fade_factor),
-                        int(self.color[1] * fade_factor),
-                        int(self.color[2] * fade_factor),
-                    )
-                else:
-                    color = self.color
-                colors.append(color)
-            else:
-                colors.append((0, 0, 0))  # Off
-        
-        # Apply reverse direction if configured
-        colors = self.apply_reverse(colors)
-
-        # Use per-LED control if JSON client available
+        # Use per-LED control if JSON client available, skipping the frame
+        # when the bar has not moved by a whole LED since the last one
+        frame_key = (self.position, current_bar_size, led_count)
         if self.json_client:
-            try:
-                await self.set_individual_leds(colors)
-            except Exception as err:
-                _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=self.color,
-                )
+            if frame_key != self._last_frame_key:
+                try:
+                    await self._send_frame(
+                        self._render_bar(led_count, current_bar_size)
+                    )
+                    self._last_frame_key = frame_key
+                except Exception as err:
+                    _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
+                    self._last_frame_key = None
+                    self._prev_frame = None
+                    await self.send_color(self.color)
         else:
             # No JSON client - use basic command
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=self.color,
-            )
+            await self.send_color(self.color)
         
         # Update position if not controlled by state
         if state_value is None or self.state_controls != "position":
@@ -214,6 +208,53 @@ class LoadingEffect(WLEDEffectBase):
         
         await asyncio.sleep(current_speed)
 
+    async def _send_frame(self, frame: np.ndarray) -> None:
+        """Send a frame, limited to the LEDs that changed since the last one.
+
+        Only the span from the first to the last changed LED is sent, so a
+        moving bar costs about two bar lengths per frame instead of the
+        whole segment.
+
+        Args:
+            frame: (N, 3) uint8 array with one RGB row per LED
+        """
+        prev = self._prev_frame
+        if prev is None or len(prev) != len(frame):
+            await self.set_individual_leds(frame)
+        else:
+            changed = np.flatnonzero((frame != prev).any(axis=1))
+            if len(changed):
+                first, last = int(changed[0]), int(changed[-1]) + 1
+                await self.set_individual_leds(frame[first:last], start_index=first)
+        self._prev_frame = frame
+
+    def _render_bar(self, led_count: int, bar_size: int) -> np.ndarray:
+        """Render the loading bar at the current position.
+
+        Args:
+            led_count: Number of LEDs in the segment
+            bar_size: Bar size in LEDs
+
+        Returns:
+            (N, 3) uint8 array with one RGB row per LED
+        """
+        # Calculate which LEDs should be lit, as one (N, 3) array
+        if len(self._idx) != led_count:
+            self._idx = np.arange(led_count)
+        distance = np.abs(self._idx - self.position)
+        
+        if bar_size <= 0:
+            fade = np.zeros(led_count)
+        elif self.trail_fade:
+            # Fade based on distance; LEDs outside the bar clip to off
+            fade = np.clip(1.0 - distance / bar_size, 0.0, None)
+        else:
+            fade = (distance < bar_size).astype(np.float64)
+        colors = (fade[:, None] * self._color_arr).astype(np.uint8)
+        
+        # Apply reverse direction if configured
+        return self.apply_reverse(colors)
+
     @classmethod
     def config_schema(cls) -> dict[str, Any]:
         """Return config schema for loading effect.
@@ -281,13 +322,19 @@ class LoadingEffect(WLEDEffectBase):
         """Reload configuration from self.config dictionary."""
         super().reload_config()
         
+        if self.start_led is not None and self.stop_led is not None:
+            self._led_count = (self.stop_led - self.start_led) + 1
+        
         # Reload effect-specific config
         self.color = self._parse_color(
             self.config.get("color", "0,255,0")
         )
+        self._color_arr = np.array(self.color, dtype=np.float64)
         self.bar_size = self.config.get("bar_size", 5)
         self.speed = self.config.get("speed", 0.03)
         self.trail_fade = self.config.get("trail_fade", True)
+        self._last_frame_key = None
+        self._prev_frame = None
         self.state_entity = self.config.get("state_entity")
         self.state_attribute = self.config.get("state_attribute")
         self.state_controls = self.config.get("state_controls", "speed")
@@ -245,19 +245,11 @@ class MeterEffect(WLEDEffectBase):
                 # Fallback to basic command if per-LED fails
                 _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
                 primary_color = self._get_color_for_level(self.current_level)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=primary_color,
-                )
+                await self.send_color(primary_color)
         else:
             # No JSON client - use basic command with average color
             primary_color = self._get_color_for_level(self.current_level)
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=primary_color,
-            )
+            await self.send_color(primary_color)
         
         # Control update rate
         await asyncio.sleep(0.03)
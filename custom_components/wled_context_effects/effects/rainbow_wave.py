@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-import colorsys
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from ..coordinator import StateSourceCoordinator
 from ..effects.base import WLEDEffectBase
 from ..effects.registry import register_effect
@@ -14,6 +15,30 @@ if TYPE_CHECKING:
 
     from homeassistant.core import HomeAssistant
 
+# HSV sector offsets for the red, green and blue channels
+_HSV_CHANNEL_OFFSETS = np.array([5.0, 3.0, 1.0])
+
+
+def _hue_to_rgb(hues: np.ndarray) -> np.ndarray:
+    """Convert hues to fully saturated, full value RGB colors.
+
+    Vectorized equivalent of colorsys.hsv_to_rgb(h, 1.0, 1.0) scaled to
+    0-255 and truncated like int().
+
+    Args:
+        hues: Array of hues between 0.0 and 1.0
+
+    Returns:
+        (N, 3) uint8 array of colors
+    """
+    k = (_HSV_CHANNEL_OFFSETS + hues[:, None] * 6.0) % 6.0
+    return ((1.0 - np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)) * 255).astype(np.uint8)
+
+
+# Rainbow lookup table: 256 steps per hue sector covers every distinct 8-bit color
+_HUE_LUT_SIZE = 6 * 256
+_HUE_LUT = _hue_to_rgb(np.arange(_HUE_LUT_SIZE) / _HUE_LUT_SIZE)
+
 
 @register_effect
 class RainbowWaveEffect(WLEDEffectBase):
@@ -56,6 +81,16 @@ class RainbowWaveEffect(WLEDEffectBase):
         
         # Animation state
         self.color_offset: float = 0.0
+        # LED count of the segment, updated on setup and config reload
+        self._led_count: int = 0
+        
+        # LED positions in LUT steps, cached per (led_count, wavelength), and
+        # per-frame work buffers reused so rendering allocates nothing
+        self._positions: np.ndarray | None = None
+        self._positions_key: tuple[int, int] | None = None
+        self._hue_buf: np.ndarray = np.empty(0)
+        self._index_buf: np.ndarray = np.empty(0, dtype=np.intp)
+        self._frame: np.ndarray = np.empty((0, 3), dtype=np.uint8)
         self.state_coordinator: StateSourceCoordinator | None = None
 
     async def setup(self) -> bool:
@@ -63,6 +98,8 @@ class RainbowWaveEffect(WLEDEffectBase):
         if not await super().setup():
             return False
         
+        self._led_count = (self.stop_led - self.start_led) + 1
+        
         # Create state coordinator if entity specified
         if self.state_entity:
             self.state_coordinator = StateSourceCoordinator(
@@ -125,49 +162,42 @@ class RainbowWaveEffect(WLEDEffectBase):
                     state_value, 0.0, 1.0, 10.0, 200.0, smooth=True
                 ))
 
-        # Generate rainbow colors for each LED
-        colors: list[tuple[int, int, int]] = []
-        
-        led_count = (self.stop_led - self.start_led) + 1
-        
-        for i in range(led_count):
-            # Calculate hue based on position and offset
-            hue = ((i / current_wavelength) + self.color_offset) % 1.0
-            
-            # Convert HSV to RGB (full saturation and value)
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            
-            # Scale to 0-255 range
-            color = (
-                int(rgb[0] * 255),
-                int(rgb[1] * 255),
-                int(rgb[2] * 255),
+        led_count = self._led_count
+
+        if self.json_client:
+            # Generate rainbow colors for all LEDs with one gather from the LUT
+            key = (led_count, current_wavelength)
+            if self._positions_key != key:
+                self._positions = np.arange(led_count) / current_wavelength * _HUE_LUT_SIZE
+                self._positions_key = key
+                if len(self._frame) != led_count:
+                    self._hue_buf = np.empty(led_count)
+                    self._index_buf = np.empty(led_count, dtype=np.intp)
+                    self._frame = np.empty((led_count, 3), dtype=np.uint8)
+            np.add(self._positions, self.color_offset * _HUE_LUT_SIZE, out=self._hue_buf)
+            np.copyto(self._index_buf, self._hue_buf, casting="unsafe")
+            colors = np.take(
+                _HUE_LUT, self._index_buf, axis=0, out=self._frame, mode="wrap"
             )
-            colors.append(color)
 
-        # Apply reverse direction if configured
-        colors = self.apply_reverse(colors)
+            # Apply reverse direction if configured
+            colors = self.apply_reverse(colors)
 
-        # Use per-LED control if JSON client available
-        if self.json_client:
             try:
                 await self.set_individual_leds(colors)
             except Exception as err:
                 # Fallback to basic command if per-LED fails
-                primary_color = colors[0] if colors else (255, 0, 0)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=primary_color,
-                )
+                primary_color = tuple(colors[0].tolist()) if len(colors) else (255, 0, 0)
+                await self.send_color(primary_color)
         else:
-            # No JSON client - use basic command with first color
-            primary_color = colors[0] if colors else (255, 0, 0)
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=primary_color,
+            # No JSON client - only the first LED's color is sent, so only
+            # that LED (the last one when reversed) is rendered
+            first_led = led_count - 1 if self.reverse_direction else 0
+            lut_index = int(
+                (first_led / current_wavelength + self.color_offset) * _HUE_LUT_SIZE
             )
+            primary_color = tuple(_HUE_LUT[lut_index % _HUE_LUT_SIZE].tolist())
+            await self.send_color(primary_color)
 
         # Advance the wave
         self.color_offset = (self.color_offset + (current_speed / 100.0)) % 1.0
@@ -239,6 +269,9 @@ class RainbowWaveEffect(WLEDEffectBase):
         """Reload configuration from self.config dictionary."""
         super().reload_config()
         
+        if self.start_led is not None and self.stop_led is not None:
+            self._led_count = (self.stop_led - self.start_led) + 1
+        
         # Reload effect-specific config
         self.wave_speed = self.config.get("wave_speed", 1.0)
         self.wave_length = self.config.get("wave_length", 60)
@@ -94,7 +94,7 @@ class EffectRegistry:
         return {
             "name": name,
             "description": effect_class.__doc__ or "No description available",
-            "config_schema": effect_class.config_schema(),
+            "config_schema": effect_class.cached_config_schema(),
         }
 
     def get_all_effects_info(self) -> dict[str, dict[str, Any]]:
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from ..coordinator import StateSourceCoordinator
-from ..effects.base import WLEDEffectBase
+from ..effects.base import WLEDEffectBase, parse_color
 from ..effects.registry import register_effect
 
 if TYPE_CHECKING:
@@ -16,6 +19,79 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# OKLab conversion matrices, linear sRGB <-> LMS <-> Lab
+_LMS_FROM_LINEAR = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_LAB_FROM_LMS = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_LMS_FROM_LAB = np.array([
+    [1.0, 0.3963377774, 0.2158037573],
+    [1.0, -0.1055613458, -0.0638541728],
+    [1.0, -0.0894841775, -1.2914855480],
+])
+_LINEAR_FROM_LMS = np.array([
+    [4.0767416621, -3.3077115913, 0.2309699292],
+    [-1.2684380046, 2.6097574011, -0.3413193965],
+    [-0.0041960863, -0.7034186147, 1.7076147010],
+])
+
+
+def _srgb_to_oklab(color: tuple[int, int, int]) -> np.ndarray:
+    """Convert an 8-bit sRGB color to OKLab.
+
+    Args:
+        color: RGB color
+
+    Returns:
+        (L, a, b) array
+    """
+    c = np.array(color, dtype=np.float64) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    return _LAB_FROM_LMS @ np.cbrt(_LMS_FROM_LINEAR @ linear)
+
+
+@functools.lru_cache(maxsize=32)
+def _oklab_fade_lut(
+    color1: tuple[int, int, int], color2: tuple[int, int, int], steps: int
+) -> np.ndarray:
+    """Build a perceptually uniform color1 to color2 ramp.
+
+    Interpolates in OKLab so the fade keeps even lightness instead of
+    dipping in the middle like a linear RGB blend. Cached so effects with the
+    same endpoints share one table.
+
+    Args:
+        color1: Start RGB color
+        color2: End RGB color
+        steps: Number of steps in the ramp
+
+    Returns:
+        Read-only (steps + 1, 3) uint8 array; row k is the color at k / steps
+    """
+    lab1 = _srgb_to_oklab(color1)
+    lab2 = _srgb_to_oklab(color2)
+    t = (np.arange(steps + 1) / steps)[:, None]
+    lab = lab1 + (lab2 - lab1) * t
+    linear = np.clip((lab @ _LMS_FROM_LAB.T) ** 3 @ _LINEAR_FROM_LMS.T, 0.0, 1.0)
+    srgb = np.where(
+        linear <= 0.0031308,
+        linear * 12.92,
+        1.055 * linear ** (1 / 2.4) - 0.055,
+    )
+    lut = np.rint(srgb * 255.0).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+# Steps in the ramp sampled by per-LED patterns, one per 8-bit level
+_PATTERN_LUT_STEPS = 255
+
 
 @register_effect
 class SegmentFadeEffect(WLEDEffectBase):
@@ -61,6 +137,8 @@ class SegmentFadeEffect(WLEDEffectBase):
         )
         self.transition_speed: float = config.get("transition_speed", 1.0)
         self.steps: int = config.get("steps", 100)
+        self._inv_steps: float = 1.0 / self.steps
+        self._step_delay: float = self.transition_speed / self.steps
         self.pattern_mode: str = config.get("pattern_mode", "gradient")  # gradient, traveling, wave, alternating
         
         # State-reactive configuration (optional)
@@ -73,7 +151,16 @@ class SegmentFadeEffect(WLEDEffectBase):
         # Animation state
         self.current_step: int = 0
         self.direction: int = 1  # 1 for forward, -1 for reverse
+        # Event loop time at which the next step is due, None until first frame
+        self._next_deadline: float | None = None
         self.state_coordinator: StateSourceCoordinator | None = None
+        
+        # Segment-level fade colors per step, and the finer ramp per-LED
+        # patterns sample from
+        self._fade_lut: np.ndarray = self._build_fade_lut()
+        self._pattern_lut: np.ndarray = _oklab_fade_lut(
+            self.color1, self.color2, _PATTERN_LUT_STEPS
+        )
 
     async def setup(self) -> bool:
         """Setup effect with optional state coordinator."""
@@ -116,42 +203,24 @@ class SegmentFadeEffect(WLEDEffectBase):
         normalized = (raw_value - self.state_min) / value_range
         return max(0.0, min(1.0, normalized))
 
-    def _parse_color(self, color_str: str) -> tuple[int, int, int]:
-        """Parse color from string format.
-
-        Args:
-            color_str: Color in format "R,G,B"
+    def _build_fade_lut(self) -> np.ndarray:
+        """Precompute the color1 to color2 fade for every step.
 
         Returns:
-            RGB tuple
+            (steps + 1, 3) uint8 array; row k is the color at position k / steps
         """
-        try:
-            parts = color_str.split(",")
-            return (int(parts[0]), int(parts[1]), int(parts[2]))
-        except (ValueError, IndexError):
-            return (255, 255, 255)  # Default to white
+        return _oklab_fade_lut(self.color1, self.color2, self.steps)
 
-    def _interpolate_color(
-        self,
-        color1: tuple[int, int, int],
-        color2: tuple[int, int, int],
-        position: float,
-    ) -> tuple[int, int, int]:
-        """Interpolate between two colors.
+    def _parse_color(self, color_str: str) -> tuple[int, int, int]:
+        """Parse color from string format.
 
         Args:
-            color1: First color (RGB)
-            color2: Second color (RGB)
-            position: Position between colors (0.0 to 1.0)
+            color_str: Color in format "R,G,B"
 
         Returns:
-            Interpolated RGB color
+            RGB tuple
         """
-        return (
-            int(color1[0] + (color2[0] - color1[0]) * position),
-            int(color1[1] + (color2[1] - color1[1]) * position),
-            int(color1[2] + (color2[2] - color1[2]) * position),
-        )
+        return parse_color(color_str, (255, 255, 255))  # Default to white
 
     async def run_effect(self) -> None:
         """Render gradient fade animation with per-LED control."""
@@ -167,10 +236,12 @@ class SegmentFadeEffect(WLEDEffectBase):
         if state_value is not None and self.state_controls == "position":
             # State directly controls position in fade cycle
             position = state_value
+            fade_step = int(position * self.steps)
             # No auto-advancement when state controls position
         else:
             # Normal auto-cycling behavior
-            position = self.current_step / self.steps
+            position = self.current_step * self._inv_steps
+            fade_step = self.current_step
             
             # Update step for next iteration
             self.current_step += self.direction
@@ -187,7 +258,7 @@ class SegmentFadeEffect(WLEDEffectBase):
         led_colors = self._generate_pattern(position)
         
         # Try per-LED control first
-        if self.json_client and led_colors:
+        if self.json_client and len(led_colors):
             try:
                 await self.set_individual_leds(led_colors)
                 # Control fade speed
@@ -196,18 +267,14 @@ class SegmentFadeEffect(WLEDEffectBase):
                     speed_multiplier = self.map_value(
                         state_value, 0.0, 1.0, 0.1, 10.0, smooth=True
                     )
-                await asyncio.sleep((self.transition_speed / self.steps) / speed_multiplier)
+                await self._sleep_until_next_step(self._step_delay / speed_multiplier)
                 return
             except Exception as err:
                 _LOGGER.warning("Per-LED control failed, falling back to segment mode: %s", err)
         
         # Fallback to segment-level control
-        current_color = self.interpolate_color(self.color1, self.color2, position)
-        await self.send_wled_command(
-            on=True,
-            brightness=self.brightness,
-            color_primary=current_color,
-        )
+        current_color = tuple(self._fade_lut[fade_step].tolist())
+        await self.send_color(current_color)
         
         # Control fade speed
         speed_multiplier = 1.0
@@ -216,62 +283,68 @@ class SegmentFadeEffect(WLEDEffectBase):
                 state_value, 0.0, 1.0, 0.1, 10.0, smooth=True
             )
         
-        await asyncio.sleep((self.transition_speed / self.steps) / speed_multiplier)
+        await self._sleep_until_next_step(self._step_delay / speed_multiplier)
+
+    async def _sleep_until_next_step(self, step_delay: float) -> None:
+        """Sleep until the next step is due on a fixed schedule.
+
+        Time spent sending the frame counts toward the step, so the fade
+        runs at the configured speed instead of drifting slower. If the
+        effect falls more than one step behind, the schedule restarts from
+        now rather than bursting frames to catch up.
+
+        Args:
+            step_delay: Seconds between steps
+        """
+        now = asyncio.get_running_loop().time()
+        if self._next_deadline is None or now - self._next_deadline > step_delay:
+            self._next_deadline = now
+        self._next_deadline += step_delay
+        # Always yield, even when the frame overran its slot
+        await asyncio.sleep(max(0.0, self._next_deadline - now))
     
-    def _generate_pattern(self, position: float) -> list[tuple[int, int, int]]:
+    def _generate_pattern(self, position: float) -> np.ndarray:
         """Generate per-LED color pattern based on mode.
         
+        Every LED is a point on the color1 to color2 ramp, sampled from the
+        same OKLab interpolation as the segment-level fade.
+        
         Args:
             position: Animation position (0.0 to 1.0)
             
         Returns:
-            List of RGB tuples for each LED
+            (N, 3) uint8 array with one RGB row per LED
         """
         # Calculate LED count
         led_count = (self.stop_led - self.start_led) + 1 if self.stop_led and self.start_led is not None else 0
         
-        if not led_count:
-            return []
+        if not led_count or self.pattern_mode not in ("gradient", "traveling", "wave", "alternating"):
+            return np.empty((0, 3), dtype=np.uint8)
         
-        colors = []
+        idx = np.arange(led_count)
         
+        # Compute each LED's position t on the ramp (0.0 = color1, 1.0 = color2)
         if self.pattern_mode == "gradient":
             # Static gradient across strip that morphs between color1 and color2
-            for i in range(led_count):
-                led_position = i / max(1, led_count - 1)
-                # Interpolate base gradient
-                base_color = self.interpolate_color(self.color1, self.color2, led_position)
-                # Morph the gradient based on animation position
-                final_color = self.interpolate_color(base_color, self.color2 if led_position < 0.5 else self.color1, position)
-                colors.append(final_color)
+            led_position = idx / max(1, led_count - 1)
+            # Morph the gradient based on animation position
+            target = (led_position < 0.5).astype(np.float64)
+            t = led_position + (target - led_position) * position
         
         elif self.pattern_mode == "traveling":
             # Traveling gradient wave
-            wave_length = led_count / 2  # Half strip width
-            for i in range(led_count):
-                # Calculate position in wave
-                wave_pos = ((i + position * led_count) % led_count) / led_count
-                color = self.interpolate_color(self.color1, self.color2, wave_pos)
-                colors.append(color)
+            t = ((idx + position * led_count) % led_count) / led_count
         
         elif self.pattern_mode == "wave":
             # Sine wave pattern
-            import math
-            for i in range(led_count):
-                # Create sine wave across strip
-                wave_value = (math.sin((i / led_count + position) * 2 * math.pi) + 1.0) / 2.0
-                color = self.interpolate_color(self.color1, self.color2, wave_value)
-                colors.append(color)
+            t = (np.sin((idx / led_count + position) * 2 * np.pi) + 1.0) / 2.0
         
-        elif self.pattern_mode == "alternating":
+        else:
             # Alternating segments that shift
             segment_size = max(1, led_count // 8)
-            for i in range(led_count):
-                segment_index = (i // segment_size + int(position * 16)) % 2
-                color = self.color1 if segment_index == 0 else self.color2
-                colors.append(color)
+            t = ((idx // segment_size + int(position * 16)) % 2).astype(np.float64)
         
-        return colors
+        return self._pattern_lut[np.rint(t * _PATTERN_LUT_STEPS).astype(np.intp)]
 
     @classmethod
     def config_schema(cls) -> dict[str, Any]:
@@ -355,7 +428,15 @@ class SegmentFadeEffect(WLEDEffectBase):
         )
         self.transition_speed = self.config.get("transition_speed", 1.0)
         self.steps = self.config.get("steps", 100)
+        self._inv_steps = 1.0 / self.steps
+        self._step_delay = self.transition_speed / self.steps
         self.pattern_mode = self.config.get("pattern_mode", "gradient")
+        self._fade_lut = self._build_fade_lut()
+        self._pattern_lut = _oklab_fade_lut(
+            self.color1, self.color2, _PATTERN_LUT_STEPS
+        )
+        self.current_step = min(self.current_step, self.steps)
+        self._next_deadline = None
         self.state_entity = self.config.get("state_entity")
         self.state_attribute = self.config.get("state_attribute")
         self.state_controls = self.config.get("state_controls", "speed")
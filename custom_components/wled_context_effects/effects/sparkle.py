@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import colorsys
 import logging
 import random
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from ..coordinator import StateSourceCoordinator
 from ..effects.base import WLEDEffectBase
 from ..effects.registry import register_effect
@@ -17,6 +20,36 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per hue sector, indices into (v, p, q, t) for the red, green and blue channels
+_HSV_SECTOR_ORDER = (
+    (0, 3, 1),
+    (2, 0, 1),
+    (1, 0, 3),
+    (1, 2, 0),
+    (3, 1, 0),
+    (0, 1, 2),
+)
+
+
+def _hsv_to_rgb(h: float, s: float, v: float) -> tuple[float, float, float]:
+    """Convert HSV to RGB with a sector table lookup instead of branches.
+
+    Produces exactly the same result as colorsys.hsv_to_rgb().
+
+    Args:
+        h: Hue between 0.0 and 1.0
+        s: Saturation between 0.0 and 1.0
+        v: Value between 0.0 and 1.0
+
+    Returns:
+        RGB tuple with channels between 0.0 and 1.0
+    """
+    i = int(h * 6.0)
+    f = (h * 6.0) - i
+    vals = (v, v * (1.0 - s), v * (1.0 - s * f), v * (1.0 - s * (1.0 - f)))
+    r, g, b = _HSV_SECTOR_ORDER[i % 6]
+    return (vals[r], vals[g], vals[b])
+
 
 @register_effect
 class SparkleEffect(WLEDEffectBase):
@@ -63,6 +96,9 @@ class SparkleEffect(WLEDEffectBase):
         self.density: float = config.get("density", 0.1)  # 0.0 to 1.0 (percentage of LEDs)
         self.fade_rate: float = config.get("fade_rate", 0.8)  # How fast sparkles fade (0.0 to 1.0)
         self.color_variation: bool = config.get("color_variation", False)  # Random hue variation
+        self._sparkle_hsv = self._to_hsv(self.sparkle_color)
+        self._sparkle_arr = np.array(self.sparkle_color, dtype=np.float64)
+        self._background_arr = np.array(self.background_color, dtype=np.float64)
         
         # State-reactive configuration (optional)
         self.state_entity: str | None = config.get("state_entity")
@@ -72,7 +108,9 @@ class SparkleEffect(WLEDEffectBase):
         self.state_max: float = config.get("state_max", 100.0)
         
         # Animation state - track brightness of each LED
-        self.led_brightness: list[float] = []
+        self.led_brightness: np.ndarray = np.zeros(0)
+        # Frame buffer, reused while the LED count stays the same
+        self._frame: np.ndarray = np.empty((0, 3), dtype=np.uint8)
         self.state_coordinator: StateSourceCoordinator | None = None
 
     async def setup(self) -> bool:
@@ -82,7 +120,7 @@ class SparkleEffect(WLEDEffectBase):
         
         # Initialize LED brightness tracking
         led_count = (self.stop_led - self.start_led) + 1
-        self.led_brightness = [0.0] * led_count
+        self.led_brightness = np.zeros(led_count)
         
         # Create state coordinator if entity specified
         if self.state_entity:
@@ -135,6 +173,18 @@ class SparkleEffect(WLEDEffectBase):
         except (ValueError, IndexError):
             return (255, 255, 255)
 
+    @staticmethod
+    def _to_hsv(color: tuple[int, int, int]) -> tuple[float, float, float]:
+        """Convert an RGB color to HSV.
+
+        Args:
+            color: RGB color
+
+        Returns:
+            HSV tuple with components between 0.0 and 1.0
+        """
+        return colorsys.rgb_to_hsv(color[0] / 255.0, color[1] / 255.0, color[2] / 255.0)
+
     def _vary_color(self, base_color: tuple[int, int, int]) -> tuple[int, int, int]:
         """Add random hue variation to color.
 
@@ -147,15 +197,16 @@ class SparkleEffect(WLEDEffectBase):
         if not self.color_variation:
             return base_color
         
-        # Convert to HSV, vary hue, convert back
-        import colorsys
-        r, g, b = [c / 255.0 for c in base_color]
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
+        # Convert to HSV (cached for the sparkle color), vary hue, convert back
+        if base_color == self.sparkle_color:
+            h, s, v = self._sparkle_hsv
+        else:
+            h, s, v = self._to_hsv(base_color)
         
         # Vary hue by +/- 0.1
         h = (h + random.uniform(-0.1, 0.1)) % 1.0
         
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
+        r, g, b = _hsv_to_rgb(h, s, v)
         return (int(r * 255), int(g * 255), int(b * 255))
 
     async def run_effect(self) -> None:
@@ -184,37 +235,37 @@ class SparkleEffect(WLEDEffectBase):
                     state_value, 0.0, 1.0, 0.95, 0.5, smooth=True
                 )
 
-        led_count = len(self.led_brightness)
+        brightness = self.led_brightness
+        led_count = len(brightness)
         
         # Randomly activate new sparkles based on density
         sparkles_to_add = int(led_count * current_density * 0.1)  # 10% chance per frame
         for _ in range(sparkles_to_add):
             led_idx = random.randint(0, led_count - 1)
             # Set to full brightness
-            self.led_brightness[led_idx] = 1.0
+            brightness[led_idx] = 1.0
         
-        # Fade all LEDs
-        for i in range(led_count):
-            if self.led_brightness[i] > 0:
-                self.led_brightness[i] *= current_fade_rate
-                # Clean up very dim LEDs
-                if self.led_brightness[i] < 0.01:
-                    self.led_brightness[i] = 0.0
+        # Fade all LEDs in place, cleaning up very dim ones
+        brightness *= current_fade_rate
+        brightness[brightness < 0.01] = 0.0
         
-        # Generate colors
-        colors: list[tuple[int, int, int]] = []
-        for brightness in self.led_brightness:
-            if brightness > 0:
-                # Interpolate between background and sparkle color
-                sparkle_color = self._vary_color(self.sparkle_color)
-                color = self.interpolate_color(
-                    self.background_color, 
-                    sparkle_color, 
-                    brightness
+        # Generate colors: background everywhere, lit LEDs interpolated
+        # towards the sparkle color
+        if len(self._frame) != led_count:
+            self._frame = np.empty((led_count, 3), dtype=np.uint8)
+        colors = self._frame
+        colors[:] = self.background_color
+        lit = np.flatnonzero(brightness)
+        if len(lit):
+            if self.color_variation:
+                sparkle = np.array(
+                    [self._vary_color(self.sparkle_color) for _ in range(len(lit))],
+                    dtype=np.float64,
                 )
-                colors.append(color)
             else:
-                colors.append(self.background_color)
+                sparkle = self._sparkle_arr
+            background = self._background_arr
+            colors[lit] = background + (sparkle - background) * brightness[lit, None]
         
         # Apply reverse direction if configured
         colors = self.apply_reverse(colors)
@@ -225,18 +276,10 @@ class SparkleEffect(WLEDEffectBase):
                 await self.set_individual_leds(colors)
             except Exception as err:
                 _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=self.sparkle_color,
-                )
+                await self.send_color(self.sparkle_color)
         else:
             # No JSON client - use basic command
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=self.sparkle_color,
-            )
+            await self.send_color(self.sparkle_color)
         
         # Control update rate
         await asyncio.sleep(0.03)
@@ -323,6 +366,9 @@ class SparkleEffect(WLEDEffectBase):
         self.density = self.config.get("density", 0.1)
         self.fade_rate = self.config.get("fade_rate", 0.8)
         self.color_variation = self.config.get("color_variation", False)
+        self._sparkle_hsv = self._to_hsv(self.sparkle_color)
+        self._sparkle_arr = np.array(self.sparkle_color, dtype=np.float64)
+        self._background_arr = np.array(self.background_color, dtype=np.float64)
         self.state_entity = self.config.get("state_entity")
         self.state_attribute = self.config.get("state_attribute")
         self.state_controls = self.config.get("state_controls", "density")
@@ -5,9 +5,12 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from ..coordinator import StateSourceCoordinator
-from ..effects.base import WLEDEffectBase
+from ..effects.base import WLEDEffectBase, parse_color
 from ..effects.registry import register_effect
+from ..rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from wled import WLED
@@ -16,6 +19,40 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lane masks for packed 0x00RRGGBB colors: red/blue share one multiply, green the other
+_MASK_RB = 0x00FF00FF
+_MASK_G = 0x0000FF00
+
+
+def _pack_rgb(color: tuple[int, int, int]) -> int:
+    """Pack an RGB tuple into a 0x00RRGGBB integer."""
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+
+def _unpack_rgb(packed: int) -> tuple[int, int, int]:
+    """Unpack a 0x00RRGGBB integer into an RGB tuple."""
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+def _lerp_rgb(c1: int, c2: int, pos_q8: int) -> int:
+    """Interpolate two packed colors with SWAR lane arithmetic.
+
+    Red and blue are 16 bits apart, so both lanes are blended with a single
+    multiply-add without carrying into each other; green is blended separately.
+
+    Args:
+        c1: First packed color (0x00RRGGBB)
+        c2: Second packed color (0x00RRGGBB)
+        pos_q8: Position between colors in 1/256 steps (0 to 256)
+
+    Returns:
+        Interpolated packed color
+    """
+    inv = 256 - pos_q8
+    rb = ((c1 & _MASK_RB) * inv + (c2 & _MASK_RB) * pos_q8) >> 8
+    g = ((c1 & _MASK_G) * inv + (c2 & _MASK_G) * pos_q8) >> 8
+    return (rb & _MASK_RB) | (g & _MASK_G)
+
 
 @register_effect
 class StateSyncEffect(WLEDEffectBase):
@@ -27,6 +64,25 @@ class StateSyncEffect(WLEDEffectBase):
     Uses per-LED control for accurate fill visualizations.
     """
 
+    _DEFAULTS: dict[str, Any] = {
+        "state_entity": "",
+        "state_attribute": None,
+        "min_value": 0.0,
+        "max_value": 100.0,
+        "animation_mode": "fill",
+        "color_low": "255,0,0",
+        "color_high": "0,255,0",
+        "update_interval": 0.05,
+    }
+
+    # Lit-LED mask builder per animation mode, bound once per config load
+    _RENDERERS: dict[str, str] = {
+        "fill": "_mask_fill",
+        "center": "_mask_center",
+        "dual": "_mask_dual",
+        "solid": "_mask_solid",
+    }
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -45,22 +101,40 @@ class StateSyncEffect(WLEDEffectBase):
         super().__init__(hass, wled_client, config, json_client)
         
         # Effect-specific configuration
-        self.state_entity: str = config.get("state_entity", "")
-        self.state_attribute: str | None = config.get("state_attribute")
-        self.min_value: float = config.get("min_value", 0.0)
-        self.max_value: float = config.get("max_value", 100.0)
-        self.animation_mode: str = config.get("animation_mode", "fill")
-        self.color_low: tuple[int, int, int] = self._parse_color(
-            config.get("color_low", "255,0,0")
-        )
-        self.color_high: tuple[int, int, int] = self._parse_color(
-            config.get("color_high", "0,255,0")
-        )
-        self.update_interval: float = config.get("update_interval", 0.05)
+        self.state_entity: str = ""
+        self.state_attribute: str | None = None
+        self.min_value: float = 0.0
+        self.max_value: float = 100.0
+        self.animation_mode: str = "fill"
+        self.color_low: tuple[int, int, int] = (255, 0, 0)
+        self.color_high: tuple[int, int, int] = (0, 255, 0)
+        self.update_interval: float = 0.05
+        # Packed endpoint colors for the per-frame interpolation
+        self._c_low_u32: int = 0
+        self._c_high_u32: int = 0
+        # Per-frame constants derived from the LED range and value range
+        self._led_count: int = 0
+        self._center: int = 0
+        self._inv_range: float = 0.0
+        self._apply_config(config)
         
         # State source coordinator
         self.state_coordinator: StateSourceCoordinator | None = None
 
+        # Reused per-LED color buffer and LED index vector (allocated in setup).
+        # Only needed when a JSON client can actually send per-LED data.
+        self._needs_pixel_buffer: bool = json_client is not None
+        self._color_buf: np.ndarray | None = None
+        self._idx: np.ndarray | None = None
+
+        # Latest-wins frame slot drained by the sender task while running
+        self._pending_frame: tuple[np.ndarray | None, tuple[int, int, int]] | None = None
+        self._frame_ready = asyncio.Event()
+        self._sender_task: asyncio.Task | None = None
+        # Paces the sender, and the last send error for run_effect to raise
+        self._rate_limiter = RateLimiter()
+        self._sender_error: Exception | None = None
+
     async def setup(self) -> bool:
         """Setup effect with state source coordinator.
 
@@ -69,6 +143,8 @@ class StateSyncEffect(WLEDEffectBase):
         """
         if not await super().setup():
             return False
+        # LED range may have just been auto-detected
+        self._recompute_constants()
         
         # Create state source coordinator if entity is specified
         if self.state_entity:
@@ -79,30 +155,55 @@ class StateSyncEffect(WLEDEffectBase):
             )
             await self.state_coordinator.async_setup()
             await self.state_coordinator.async_config_entry_first_refresh()
+
+        if self._needs_pixel_buffer:
+            self._allocate_buffers()
+        else:
+            _LOGGER.debug(
+                "No JSON API client for %s, skipping per-LED buffer rendering",
+                self.__class__.__name__,
+            )
+        self._last_value_q = None
         
         return True
 
+    async def start(self) -> None:
+        """Start effect and its frame sender."""
+        await super().start()
+        if self._running and self._sender_task is None:
+            self._sender_task = self.hass.async_create_task(self._sender_loop())
+
     async def stop(self) -> None:
         """Stop the effect and clean up state coordinator."""
-        await super().stop()
+        if self._sender_task:
+            self._sender_task.cancel()
+            try:
+                await self._sender_task
+            except asyncio.CancelledError:
+                pass
+            self._sender_task = None
+            self._pending_frame = None
+            self._sender_error = None
         
+        # Base stop and coordinator teardown touch disjoint resources
+        coros = [super().stop()]
         if self.state_coordinator:
-            await self.state_coordinator.async_shutdown()
+            coros.append(self.state_coordinator.async_shutdown())
+        await asyncio.gather(*coros)
 
-    def _parse_color(self, color_str: str) -> tuple[int, int, int]:
-        """Parse color from string format.
+    def _allocate_buffers(self) -> None:
+        """Allocate the per-LED color buffer and index vector for the current LED range."""
+        led_count = self._led_count
+        self._color_buf = np.zeros((led_count, 3), dtype=np.uint8)
+        self._idx = np.arange(led_count, dtype=np.int32)
 
-        Args:
-            color_str: Color in format "R,G,B"
-
-        Returns:
-            RGB tuple
-        """
-        try:
-            parts = color_str.split(",")
-            return (int(parts[0]), int(parts[1]), int(parts[2]))
-        except (ValueError, IndexError):
-            return (255, 255, 255)
+    def _recompute_constants(self) -> None:
+        """Recompute per-frame constants after the LED or value range changes."""
+        value_range = self.max_value - self.min_value
+        self._inv_range = 1.0 / value_range if value_range > 0 else 0.0
+        if self.start_led is not None and self.stop_led is not None:
+            self._led_count = (self.stop_led - self.start_led) + 1
+            self._center = self._led_count // 2
 
     def _get_current_value(self) -> float:
         """Get current state value as percentage.
@@ -118,38 +219,41 @@ class StateSyncEffect(WLEDEffectBase):
         )
         
         # Normalize to 0-1 range
-        value_range = self.max_value - self.min_value
-        if value_range <= 0:
+        if self._inv_range == 0.0:
             return 0.5
         
-        return (raw_value - self.min_value) / value_range
+        return (raw_value - self.min_value) * self._inv_range
 
-    def _interpolate_color(
-        self,
-        color1: tuple[int, int, int],
-        color2: tuple[int, int, int],
-        position: float,
-    ) -> tuple[int, int, int]:
-        """Interpolate between two colors.
+    def _mask_fill(self, led_count: int, value: float) -> np.ndarray:
+        """Fill from start to position."""
+        return self._idx < int(led_count * value)
 
-        Args:
-            color1: First color (RGB)
-            color2: Second color (RGB)
-            position: Position between colors (0.0 to 1.0)
+    def _mask_center(self, led_count: int, value: float) -> np.ndarray:
+        """Fill from center outward."""
+        spread = int((led_count / 2) * value)
+        return np.abs(self._idx - self._center) < spread
 
-        Returns:
-            Interpolated RGB color
-        """
-        return (
-            int(color1[0] + (color2[0] - color1[0]) * position),
-            int(color1[1] + (color2[1] - color1[1]) * position),
-            int(color1[2] + (color2[2] - color1[2]) * position),
-        )
+    def _mask_dual(self, led_count: int, value: float) -> np.ndarray:
+        """Fill from both ends toward center."""
+        spread = int((led_count / 2) * value)
+        return (self._idx < spread) | (self._idx >= led_count - spread)
+
+    def _mask_solid(self, led_count: int, value: float) -> None:
+        """Entire strip same color based on value."""
+        return None
 
     async def run_effect(self) -> None:
         """Render state visualization."""
+        # Surface a failed send so the effect loop counts it and backs off
+        if self._sender_error is not None:
+            err, self._sender_error = self._sender_error, None
+            self._last_value_q = None
+            raise err
+
         # Check manual override
         if await self.check_manual_override():
+            # Repaint once the override ends
+            self._last_value_q = None
             await asyncio.sleep(0.1)
             return
 
@@ -160,71 +264,104 @@ class StateSyncEffect(WLEDEffectBase):
         if self.value_smoother:
             value = self.value_smoother.smooth(value)
         
-        led_count = (self.stop_led - self.start_led) + 1
-        lit_count = int(led_count * value)
-        
-        # Use base class color interpolation
-        current_color = self.interpolate_color(self.color_low, self.color_high, value)
+        # Skip frames that would render the same: same color step, same number
+        # of lit LEDs for fill, and same spread for center/dual
+        led_count = self._led_count
+        pos_q8 = int(value * 256)
+        value_q = (pos_q8, int(led_count * value), int((led_count / 2) * value))
+        if value_q == self._last_value_q:
+            await asyncio.sleep(self.update_interval)
+            return
+        self._last_value_q = value_q
         
-        if self.animation_mode == "fill":
-            # Fill from start to position
-            colors: list[tuple[int, int, int]] = []
-            for i in range(led_count):
-                if i < lit_count:
-                    colors.append(current_color)
-                else:
-                    colors.append((0, 0, 0))
+        # Interpolate on the packed endpoint colors (value is already 0.0-1.0)
+        current_color = _unpack_rgb(
+            _lerp_rgb(self._c_low_u32, self._c_high_u32, pos_q8)
+        )
         
-        elif self.animation_mode == "center":
-            # Fill from center outward
-            center = led_count // 2
-            spread = int((led_count / 2) * value)
-            colors = []
-            for i in range(led_count):
-                distance_from_center = abs(i - center)
-                if distance_from_center < spread:
-                    colors.append(current_color)
-                else:
-                    colors.append((0, 0, 0))
+        # Without per-LED output only the segment color is sent, so skip the buffer
+        if not self._needs_pixel_buffer:
+            await self._dispatch_frame(None, current_color)
+            await asyncio.sleep(self.update_interval)
+            return
         
-        elif self.animation_mode == "dual":
-            # Fill from both ends toward center
-            spread = int((led_count / 2) * value)
-            colors = []
-            for i in range(led_count):
-                if i < spread or i >= (led_count - spread):
-                    colors.append(current_color)
-                else:
-                    colors.append((0, 0, 0))
+        # Reuse the preallocated buffer, reallocating only if the range changed
+        if self._color_buf is None or len(self._color_buf) != led_count:
+            self._allocate_buffers()
+        buf = self._color_buf
+        mask = self._renderer(led_count, value)
         
-        else:  # solid
-            # Entire strip same color based on value
-            colors = [current_color] * led_count
+        if mask is None:
+            buf[:] = current_color
+        else:
+            buf[:] = 0
+            buf[mask] = current_color
         
-        # Apply reverse if configured
-        colors = self.apply_reverse(colors)
+        # Apply reverse if configured (flipped view, no copy)
+        colors = np.flip(buf, axis=0) if self.reverse_direction else buf
+        await self._dispatch_frame(colors, current_color)
         
-        # Use per-LED control if JSON client available
-        if self.json_client:
+        # Control update rate
+        await asyncio.sleep(self.update_interval)
+
+    async def _dispatch_frame(
+        self, colors: np.ndarray | None, current_color: tuple[int, int, int]
+    ) -> None:
+        """Hand a rendered frame to the sender, or send it directly.
+
+        While the effect loop runs, frames go to a single pending slot that the
+        sender task drains, so a frame still waiting when the next one is
+        rendered is replaced instead of sent. One-shot runs send immediately.
+
+        Args:
+            colors: Per-LED colors, or None to only set the segment color
+            current_color: Segment color for the value
+        """
+        if self._sender_task is None:
+            await self._send_frame(colors, current_color)
+            return
+        # Copy since the render buffer is reused by the next frame
+        self._pending_frame = (
+            None if colors is None else colors.copy(),
+            current_color,
+        )
+        self._frame_ready.set()
+
+    async def _sender_loop(self) -> None:
+        """Send the most recent pending frame whenever one is ready.
+
+        Sends are paced by the rate limiter. A failed send is handed to
+        run_effect, which raises it on the next frame.
+        """
+        while True:
+            await self._frame_ready.wait()
+            self._frame_ready.clear()
+            frame = self._pending_frame
+            self._pending_frame = None
+            if frame is None:
+                continue
+            try:
+                await self._rate_limiter.acquire()
+                await self._send_frame(*frame)
+            except Exception as err:
+                self._sender_error = err
+
+    async def _send_frame(
+        self, colors: np.ndarray | None, current_color: tuple[int, int, int]
+    ) -> None:
+        """Send one frame to WLED.
+
+        Args:
+            colors: Per-LED colors, or None to only set the segment color
+            current_color: Segment color, also used as the per-LED fallback
+        """
+        if colors is not None:
             try:
                 await self.set_individual_leds(colors)
+                return
             except Exception as err:
                 _LOGGER.warning("Per-LED control failed, using fallback: %s", err)
-                await self.send_wled_command(
-                    on=True,
-                    brightness=self.brightness,
-                    color_primary=current_color,
-                )
-        else:
-            # No JSON client - use basic command
-            await self.send_wled_command(
-                on=True,
-                brightness=self.brightness,
-                color_primary=current_color,
-            )
-        
-        # Control update rate
-        await asyncio.sleep(self.update_interval)
+        await self.send_color(current_color)
 
     @classmethod
     def config_schema(cls) -> dict[str, Any]:
@@ -289,15 +426,29 @@ class StateSyncEffect(WLEDEffectBase):
         super().reload_config()
         
         # Reload effect-specific config
-        self.state_entity = self.config.get("state_entity", "")
-        self.state_attribute = self.config.get("state_attribute")
-        self.min_value = self.config.get("min_value", 0.0)
-        self.max_value = self.config.get("max_value", 100.0)
-        self.animation_mode = self.config.get("animation_mode", "fill")
-        self.color_low = self._parse_color(
-            self.config.get("color_low", "255,0,0")
-        )
-        self.color_high = self._parse_color(
-            self.config.get("color_high", "0,255,0")
+        self._apply_config(self.config)
+        # Rebuild per-LED buffers on the next frame
+        self._color_buf = None
+
+    def _apply_config(self, config: dict[str, Any]) -> None:
+        """Apply effect-specific configuration merged over class defaults.
+
+        Args:
+            config: Effect configuration
+        """
+        merged = {**self._DEFAULTS, **config}
+        self.state_entity = merged["state_entity"]
+        self.state_attribute = merged["state_attribute"]
+        self.min_value = merged["min_value"]
+        self.max_value = merged["max_value"]
+        self.animation_mode = merged["animation_mode"]
+        self.color_low = parse_color(merged["color_low"], (255, 255, 255))
+        self.color_high = parse_color(merged["color_high"], (255, 255, 255))
+        self._c_low_u32 = _pack_rgb(self.color_low)
+        self._c_high_u32 = _pack_rgb(self.color_high)
+        self.update_interval = merged["update_interval"]
+        self._recompute_constants()
+        self._last_value_q: tuple[int, int, int] | None = None
+        self._renderer = getattr(
+            self, self._RENDERERS.get(self.animation_mode, "_mask_solid")
         )
-        self.update_interval = self.config.get("update_interval", 0.05)
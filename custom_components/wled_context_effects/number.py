@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -50,16 +51,24 @@ async def async_setup_entry(
     """
     coordinator: EffectCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
+    # Build device info once and share it across all entities of this entry
+    device_info = create_device_info(
+        entry,
+        entry.data.get(CONF_WLED_UNIQUE_ID, ""),
+        entry.options.get("effect_name", "Effect"),
+        entry.data.get("effect_type", ""),
+    )
+
     entities = [
-        WLEDEffectBrightnessNumber(coordinator, entry),
-        WLEDEffectSegmentNumber(coordinator, entry),
+        WLEDEffectBrightnessNumber(coordinator, entry, device_info),
+        WLEDEffectSegmentNumber(coordinator, entry, device_info),
     ]
     
     # Add LED range entities if configured
     if CONF_START_LED in entry.options:
-        entities.append(WLEDEffectStartLEDNumber(coordinator, entry))
+        entities.append(WLEDEffectStartLEDNumber(coordinator, entry, device_info))
     if CONF_STOP_LED in entry.options:
-        entities.append(WLEDEffectStopLEDNumber(coordinator, entry))
+        entities.append(WLEDEffectStopLEDNumber(coordinator, entry, device_info))
 
     async_add_entities(entities)
 
@@ -74,6 +83,7 @@ class WLEDEffectNumberBase(CoordinatorEntity[EffectCoordinator], NumberEntity):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         key: str,
         name: str,
         icon: str,
@@ -83,6 +93,7 @@ class WLEDEffectNumberBase(CoordinatorEntity[EffectCoordinator], NumberEntity):
         Args:
             coordinator: Effect coordinator
             entry: Config entry
+            device_info: Shared device info for the effect
             key: Configuration key
             name: Entity name
             icon: Entity icon
@@ -93,14 +104,7 @@ class WLEDEffectNumberBase(CoordinatorEntity[EffectCoordinator], NumberEntity):
         self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_name = name
         self._attr_icon = icon
-        
-        # Set device info
-        wled_unique_id = entry.data.get(CONF_WLED_UNIQUE_ID, "")
-        effect_type = entry.data.get("effect_type", "")
-        effect_name = entry.options.get("effect_name", "Effect")
-        self._attr_device_info = create_device_info(
-            entry, wled_unique_id, effect_name, effect_type
-        )
+        self._attr_device_info = device_info
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -121,11 +125,13 @@ class WLEDEffectBrightnessNumber(WLEDEffectNumberBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize brightness number."""
         super().__init__(
             coordinator,
             entry,
+            device_info,
             CONF_BRIGHTNESS,
             "Brightness",
             ICON_BRIGHTNESS,
@@ -149,11 +155,13 @@ class WLEDEffectSegmentNumber(WLEDEffectNumberBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize segment number."""
         super().__init__(
             coordinator,
             entry,
+            device_info,
             CONF_SEGMENT_ID,
             "Segment ID",
             ICON_SEGMENT,
@@ -177,11 +185,13 @@ class WLEDEffectStartLEDNumber(WLEDEffectNumberBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize start LED number."""
         super().__init__(
             coordinator,
             entry,
+            device_info,
             CONF_START_LED,
             "Start LED",
             ICON_LED,
@@ -205,11 +215,13 @@ class WLEDEffectStopLEDNumber(WLEDEffectNumberBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize stop LED number."""
         super().__init__(
             coordinator,
             entry,
+            device_info,
             CONF_STOP_LED,
             "Stop LED",
             ICON_LED,
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from collections import deque
+from array import array
 
 from .const import MAX_COMMANDS_PER_SECOND, RATE_LIMIT_WINDOW
 from .errors import RateLimitError
@@ -19,6 +19,8 @@ class RateLimiter:
     we don't send too many commands to WLED devices in a short time.
     """
 
+    __slots__ = ("max_commands", "window", "_timestamps", "_head", "_count", "_lock")
+
     def __init__(
         self,
         max_commands: int = MAX_COMMANDS_PER_SECOND,
@@ -29,10 +31,19 @@ class RateLimiter:
         Args:
             max_commands: Maximum commands allowed per window
             window: Time window in seconds
+
+        Raises:
+            ValueError: If max_commands is less than 1
         """
+        # The ring buffer needs at least one slot to index into
+        if max_commands < 1:
+            raise ValueError(f"max_commands must be at least 1, got {max_commands}")
         self.max_commands = max_commands
         self.window = window
-        self._timestamps: deque[float] = deque(maxlen=max_commands)
+        # Fixed-size ring of unboxed doubles; at most max_commands are ever held
+        self._timestamps = array("d", [0.0]) * max_commands
+        self._head = 0
+        self._count = 0
         self._lock = asyncio.Lock()
         _LOGGER.debug(
             "Rate limiter initialized: %d commands per %.1fs",
@@ -40,6 +51,29 @@ class RateLimiter:
             window,
         )
 
+    def _prune(self, current_time: float) -> None:
+        """Drop timestamps that fell out of the sliding window.
+
+        Timestamps are appended in order, so expired ones are always at the
+        head of the ring and are dropped by advancing the head index.
+
+        Args:
+            current_time: Current time in seconds
+        """
+        cutoff = current_time - self.window
+        while self._count and self._timestamps[self._head] < cutoff:
+            self._head = (self._head + 1) % self.max_commands
+            self._count -= 1
+
+    def _append(self, current_time: float) -> None:
+        """Record a command timestamp at the tail of the ring.
+
+        Args:
+            current_time: Current time in seconds
+        """
+        self._timestamps[(self._head + self._count) % self.max_commands] = current_time
+        self._count += 1
+
     async def acquire(self, timeout: float | None = None) -> None:
         """Acquire permission to send command.
 
@@ -52,29 +86,37 @@ class RateLimiter:
             RateLimitError: If timeout is reached
             asyncio.TimeoutError: If timeout is reached
         """
+        # Fast path: there is room in the window. Check and append happen
+        # without an await in between, so no lock is needed on the event loop.
+        current_time = time.monotonic()
+        self._prune(current_time)
+        if self._count < self.max_commands:
+            self._append(current_time)
+            return
+
+        # Slow path: window is full, serialize waiters
         async with self._lock:
-            start_time = time.time()
+            start_time = current_time
 
             while True:
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # Remove old timestamps outside the window
-                while self._timestamps and self._timestamps[0] < current_time - self.window:
-                    self._timestamps.popleft()
+                self._prune(current_time)
 
                 # Check if we can proceed
-                if len(self._timestamps) < self.max_commands:
-                    self._timestamps.append(current_time)
+                if self._count < self.max_commands:
+                    self._append(current_time)
                     _LOGGER.debug(
                         "Rate limit check passed (%d/%d commands in window)",
-                        len(self._timestamps),
+                        self._count,
                         self.max_commands,
                     )
                     return
 
                 # Calculate wait time
-                if self._timestamps:
-                    oldest = self._timestamps[0]
+                if self._count:
+                    oldest = self._timestamps[self._head]
                     wait_time = (oldest + self.window) - current_time
                 else:
                     wait_time = 0.1  # Small default wait
@@ -89,10 +131,13 @@ class RateLimiter:
                         )
                     wait_time = min(wait_time, timeout - elapsed)
 
+                # Never sleep for zero or less, or the loop would spin
+                wait_time = max(wait_time, 0.001)
+
                 _LOGGER.debug(
                     "Rate limit reached, waiting %.2fs (%d/%d commands)",
                     wait_time,
-                    len(self._timestamps),
+                    self._count,
                     self.max_commands,
                 )
                 await asyncio.sleep(wait_time)
@@ -103,13 +148,9 @@ class RateLimiter:
         Returns:
             True if under rate limit
         """
-        current_time = time.time()
-
-        # Remove old timestamps
-        while self._timestamps and self._timestamps[0] < current_time - self.window:
-            self._timestamps.popleft()
+        self._prune(time.monotonic())
 
-        return len(self._timestamps) < self.max_commands
+        return self._count < self.max_commands
 
     @property
     def current_rate(self) -> int:
@@ -118,13 +159,9 @@ class RateLimiter:
         Returns:
             Number of commands in current window
         """
-        current_time = time.time()
-
-        # Remove old timestamps
-        while self._timestamps and self._timestamps[0] < current_time - self.window:
-            self._timestamps.popleft()
+        self._prune(time.monotonic())
 
-        return len(self._timestamps)
+        return self._count
 
     @property
     def available_slots(self) -> int:
@@ -138,4 +175,5 @@ class RateLimiter:
     def reset(self) -> None:
         """Reset the rate limiter."""
         _LOGGER.debug("Resetting rate limiter")
-        self._timestamps.clear()
+        self._head = 0
+        self._count = 0
@@ -31,7 +31,7 @@ async def async_setup_entry(
     coordinator: EffectCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     # Get effect-specific select entities from config schema
-    effect_schema = coordinator.effect.config_schema()
+    effect_schema = coordinator.effect.cached_config_schema()
     entities = []
     
     for key, value_schema in effect_schema.get("properties", {}).items():
@@ -6,12 +6,11 @@ import logging
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    ATTR_LAST_ERROR,
-    ATTR_SUCCESS_RATE,
     CONF_WLED_UNIQUE_ID,
     DOMAIN,
     ICON_ERROR,
@@ -40,10 +39,18 @@ async def async_setup_entry(
     """
     coordinator: EffectCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
+    # Build device info once and share it across all entities of this entry
+    device_info = create_device_info(
+        entry,
+        entry.data.get(CONF_WLED_UNIQUE_ID, ""),
+        entry.options.get("effect_name", "Effect"),
+        entry.data.get("effect_type", ""),
+    )
+
     async_add_entities([
-        WLEDEffectStatusSensor(coordinator, entry),
-        WLEDEffectSuccessRateSensor(coordinator, entry),
-        WLEDEffectLastErrorSensor(coordinator, entry),
+        WLEDEffectStatusSensor(coordinator, entry, device_info),
+        WLEDEffectSuccessRateSensor(coordinator, entry, device_info),
+        WLEDEffectLastErrorSensor(coordinator, entry, device_info),
     ])
 
 
@@ -56,6 +63,7 @@ class WLEDEffectSensorBase(CoordinatorEntity[EffectCoordinator], SensorEntity):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         key: str,
         name: str,
     ) -> None:
@@ -64,6 +72,7 @@ class WLEDEffectSensorBase(CoordinatorEntity[EffectCoordinator], SensorEntity):
         Args:
             coordinator: Effect coordinator
             entry: Config entry
+            device_info: Shared device info for the effect
             key: Sensor key
             name: Entity name
         """
@@ -72,14 +81,7 @@ class WLEDEffectSensorBase(CoordinatorEntity[EffectCoordinator], SensorEntity):
         self._key = key
         self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_name = name
-        
-        # Set device info
-        wled_unique_id = entry.data.get(CONF_WLED_UNIQUE_ID, "")
-        effect_type = entry.data.get("effect_type", "")
-        effect_name = entry.options.get("effect_name", "Effect")
-        self._attr_device_info = create_device_info(
-            entry, wled_unique_id, effect_name, effect_type
-        )
+        self._attr_device_info = device_info
 
 
 class WLEDEffectStatusSensor(WLEDEffectSensorBase):
@@ -91,18 +93,17 @@ class WLEDEffectStatusSensor(WLEDEffectSensorBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize status sensor."""
-        super().__init__(coordinator, entry, "status", "Status")
+        super().__init__(coordinator, entry, device_info, "status", "Status")
 
     @property
     def native_value(self) -> str:
         """Return the current status."""
-        data = self.coordinator.data
-        
-        if data.get("last_error"):
+        if self.coordinator.statistics.last_error:
             return STATE_ERROR
-        elif data.get("running"):
+        elif self.coordinator.data.get("running"):
             return STATE_RUNNING
         else:
             return STATE_STOPPED
@@ -126,15 +127,15 @@ class WLEDEffectSuccessRateSensor(WLEDEffectSensorBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize success rate sensor."""
-        super().__init__(coordinator, entry, "success_rate", "Success Rate")
+        super().__init__(coordinator, entry, device_info, "success_rate", "Success Rate")
 
     @property
     def native_value(self) -> float:
         """Return the success rate."""
-        stats = self.coordinator.data.get("statistics", {})
-        return round(stats.get(ATTR_SUCCESS_RATE, 100.0), 1)
+        return round(self.coordinator.statistics.success_rate, 1)
 
 
 class WLEDEffectLastErrorSensor(WLEDEffectSensorBase):
@@ -146,13 +147,12 @@ class WLEDEffectLastErrorSensor(WLEDEffectSensorBase):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize last error sensor."""
-        super().__init__(coordinator, entry, "last_error", "Last Error")
+        super().__init__(coordinator, entry, device_info, "last_error", "Last Error")
 
     @property
     def native_value(self) -> str:
         """Return the last error."""
-        stats = self.coordinator.data.get("statistics", {})
-        error = stats.get(ATTR_LAST_ERROR)
-        return error if error else "None"
+        return self.coordinator.statistics.last_error or "None"
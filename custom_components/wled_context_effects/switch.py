@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -33,6 +34,8 @@ from .device import create_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNIQUE_ID_SUFFIX = "_switch"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -48,7 +51,14 @@ async def async_setup_entry(
     """
     coordinator: EffectCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    async_add_entities([WLEDEffectSwitch(coordinator, entry)])
+    device_info = create_device_info(
+        entry,
+        entry.data.get(CONF_WLED_UNIQUE_ID, ""),
+        entry.options.get(CONF_EFFECT_NAME, "Effect"),
+        entry.data.get("effect_type", ""),
+    )
+
+    async_add_entities([WLEDEffectSwitch(coordinator, entry, device_info)])
 
 
 class WLEDEffectSwitch(CoordinatorEntity[EffectCoordinator], SwitchEntity):
@@ -60,24 +70,20 @@ class WLEDEffectSwitch(CoordinatorEntity[EffectCoordinator], SwitchEntity):
         self,
         coordinator: EffectCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the switch.
 
         Args:
             coordinator: Effect coordinator
             entry: Config entry
+            device_info: Shared device info for the effect
         """
         super().__init__(coordinator)
         
-        self._attr_unique_id = f"{entry.entry_id}_switch"
+        self._attr_unique_id = entry.entry_id + _UNIQUE_ID_SUFFIX
         self._attr_name = entry.options.get(CONF_EFFECT_NAME, "Effect")
-        
-        # Set device info
-        wled_unique_id = entry.data.get(CONF_WLED_UNIQUE_ID, "")
-        effect_type = entry.data.get("effect_type", "")
-        self._attr_device_info = create_device_info(
-            entry, wled_unique_id, self._attr_name, effect_type
-        )
+        self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool:
@@ -95,23 +101,18 @@ class WLEDEffectSwitch(CoordinatorEntity[EffectCoordinator], SwitchEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         data = self.coordinator.data
-        stats = data.get("statistics", {})
+        stats = self.coordinator.statistics
         
         attributes = {
             ATTR_EFFECT_TYPE: data.get("effect_type"),
             ATTR_SEGMENT_ID: self.coordinator.effect.segment_id,
+            ATTR_COMMAND_COUNT: stats.command_count,
+            ATTR_SUCCESS_COUNT: stats.success_count,
+            ATTR_FAILURE_COUNT: stats.failure_count,
+            ATTR_SUCCESS_RATE: round(stats.success_rate, 1),
+            ATTR_LAST_ERROR: stats.last_error,
         }
         
-        # Add statistics
-        if stats:
-            attributes.update({
-                ATTR_COMMAND_COUNT: stats.get(ATTR_COMMAND_COUNT, 0),
-                ATTR_SUCCESS_COUNT: stats.get(ATTR_SUCCESS_COUNT, 0),
-                ATTR_FAILURE_COUNT: stats.get(ATTR_FAILURE_COUNT, 0),
-                ATTR_SUCCESS_RATE: round(stats.get(ATTR_SUCCESS_RATE, 100.0), 1),
-                ATTR_LAST_ERROR: stats.get(ATTR_LAST_ERROR),
-            })
-        
         # Add timing information
         if data.get("last_started"):
             attributes[ATTR_LAST_STARTED] = data["last_started"].isoformat()
@@ -3,29 +3,90 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 from dataclasses import dataclass
 from datetime import datetime, time
 from typing import TYPE_CHECKING, Any, Callable
 
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+)
+
+from .errors import ConfigurationError
+
 if TYPE_CHECKING:
     from homeassistant.core import Event, HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# Threshold comparison operators, resolved once per trigger at setup
+_COMPARATORS: dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+
+def _wrap_sync(callback: Callable) -> Callable:
+    """Wrap a plain callback so it can be awaited like an async one.
+
+    Args:
+        callback: Synchronous callback taking the trigger data
+
+    Returns:
+        Async function calling the callback
+    """
+
+    async def wrapper(data: dict[str, Any]) -> None:
+        callback(data)
+
+    return wrapper
+
+
+def _parse_time_pattern(pattern: str) -> time:
+    """Parse an "HH:MM" time pattern.
+
+    Args:
+        pattern: Time in HH:MM format
 
-@dataclass
+    Returns:
+        Parsed time
+
+    Raises:
+        ConfigurationError: If the pattern is not a valid HH:MM time
+    """
+    try:
+        hour, minute = map(int, pattern.split(":"))
+        return time(hour, minute)
+    except (ValueError, AttributeError) as err:
+        raise ConfigurationError(f"Invalid time pattern: {pattern}") from err
+
+
+@dataclass(slots=True)
 class TriggerConfig:
-    """Configuration for a trigger."""
+    """Configuration for a trigger.
+
+    Raises:
+        ConfigurationError: If time_pattern is not a valid HH:MM time
+    """
 
     trigger_type: str  # state_change, threshold, time, event
     entity_id: str | None = None
     attribute: str | None = None
     threshold: float | None = None
     comparison: str = ">"  # >, <, ==, >=, <=
-    time_pattern: str | None = None  # HH:MM format
+    time_pattern: time | None = None  # HH:MM string, parsed on construction
     event_type: str | None = None
     event_data: dict[str, Any] | None = None
 
+    def __post_init__(self) -> None:
+        """Parse the time pattern so bad configs fail when they are built."""
+        if self.time_pattern is not None and not isinstance(self.time_pattern, time):
+            self.time_pattern = _parse_time_pattern(self.time_pattern)
+
 
 class TriggerManager:
     """Manage triggers for context-aware effects.
@@ -44,7 +105,8 @@ class TriggerManager:
         self._triggers: dict[str, TriggerConfig] = {}
         self._callbacks: dict[str, list[Callable]] = {}
         self._listeners: list[Callable] = []
-        self._time_task: asyncio.Task | None = None
+        # State change handlers per entity, behind one HA listener each
+        self._entity_handlers: dict[str, list[Callable]] = {}
 
     def add_trigger(
         self,
@@ -57,10 +119,14 @@ class TriggerManager:
         Args:
             trigger_id: Unique identifier for trigger
             trigger_config: Trigger configuration
-            callback: Async callback function when trigger fires
+            callback: Async or plain callback function when trigger fires
         """
         self._triggers[trigger_id] = trigger_config
 
+        # Store only async callables so firing never has to check the type
+        if not asyncio.iscoroutinefunction(callback):
+            callback = _wrap_sync(callback)
+
         if trigger_id not in self._callbacks:
             self._callbacks[trigger_id] = []
         self._callbacks[trigger_id].append(callback)
@@ -105,15 +171,7 @@ class TriggerManager:
             await self._fire_trigger(trigger_id, {"value": value, "state": new_state})
 
         # Subscribe to state changes
-        from homeassistant.helpers.event import async_track_state_change_event
-        
-        self._listeners.append(
-            async_track_state_change_event(
-                self.hass,
-                config.entity_id,
-                state_changed,
-            )
-        )
+        self._subscribe_entity(config.entity_id, state_changed)
 
     async def _setup_threshold_trigger(
         self,
@@ -125,6 +183,16 @@ class TriggerManager:
             _LOGGER.warning("Threshold trigger %s missing entity_id or threshold", trigger_id)
             return
 
+        compare = _COMPARATORS.get(config.comparison)
+        if compare is None:
+            _LOGGER.warning(
+                "Threshold trigger %s has invalid comparison: %s",
+                trigger_id,
+                config.comparison,
+            )
+            return
+
+        threshold = config.threshold
         last_triggered = False
 
         async def state_changed(event: Event) -> None:
@@ -147,36 +215,53 @@ class TriggerManager:
                 return
 
             # Check threshold
-            triggered = False
-            if config.comparison == ">":
-                triggered = value > config.threshold
-            elif config.comparison == "<":
-                triggered = value < config.threshold
-            elif config.comparison == "==":
-                triggered = value == config.threshold
-            elif config.comparison == ">=":
-                triggered = value >= config.threshold
-            elif config.comparison == "<=":
-                triggered = value <= config.threshold
+            triggered = compare(value, threshold)
 
             # Fire only on transition
             if triggered and not last_triggered:
                 await self._fire_trigger(
                     trigger_id,
-                    {"value": value, "threshold": config.threshold},
+                    {"value": value, "threshold": threshold},
                 )
 
             last_triggered = triggered
 
-        from homeassistant.helpers.event import async_track_state_change_event
-        
-        self._listeners.append(
-            async_track_state_change_event(
-                self.hass,
-                config.entity_id,
-                state_changed,
+        self._subscribe_entity(config.entity_id, state_changed)
+
+    def _subscribe_entity(self, entity_id: str, handler: Callable) -> None:
+        """Add a state change handler for an entity.
+
+        All triggers watching the same entity share one Home Assistant
+        listener, which dispatches each state change to their handlers.
+
+        Args:
+            entity_id: Entity to watch
+            handler: Async handler taking the state change event
+        """
+        handlers = self._entity_handlers.get(entity_id)
+        if handlers is None:
+            handlers = self._entity_handlers[entity_id] = []
+
+            async def dispatch(event: Event) -> None:
+                """Forward a state change to every trigger on the entity."""
+                # One failing trigger must not stop the others on the entity
+                results = await asyncio.gather(
+                    *(handler(event) for handler in handlers),
+                    return_exceptions=True,
+                )
+                for handler, result in zip(handlers, results):
+                    if isinstance(result, Exception):
+                        _LOGGER.error(
+                            "Error in state change handler %r for %s: %s",
+                            handler,
+                            entity_id,
+                            result,
+                        )
+
+            self._listeners.append(
+                async_track_state_change_event(self.hass, [entity_id], dispatch)
             )
-        )
+        handlers.append(handler)
 
     async def _setup_time_trigger(
         self,
@@ -184,32 +269,26 @@ class TriggerManager:
         config: TriggerConfig,
     ) -> None:
         """Setup time-based trigger."""
-        if not config.time_pattern:
+        if config.time_pattern is None:
             _LOGGER.warning("Time trigger %s missing time_pattern", trigger_id)
             return
 
-        try:
-            hour, minute = map(int, config.time_pattern.split(":"))
-            trigger_time = time(hour, minute)
-        except (ValueError, AttributeError):
-            _LOGGER.error("Invalid time pattern: %s", config.time_pattern)
-            return
+        trigger_time = config.time_pattern
 
-        async def check_time() -> None:
-            """Check if current time matches trigger."""
-            while True:
-                now = datetime.now().time()
-                if now.hour == trigger_time.hour and now.minute == trigger_time.minute:
-                    await self._fire_trigger(trigger_id, {"time": now})
-                    # Wait until next minute to avoid duplicate triggers
-                    await asyncio.sleep(60)
-                else:
-                    # Check every 30 seconds
-                    await asyncio.sleep(30)
-
-        # Create a new task for this time trigger (don't reuse _time_task)
-        task = self.hass.async_create_task(check_time())
-        self._listeners.append(lambda: task.cancel() if not task.done() else None)
+        async def time_reached(now: datetime) -> None:
+            """Handle the scheduled trigger time."""
+            await self._fire_trigger(trigger_id, {"time": now.time()})
+
+        # Let Home Assistant schedule the callback once a day at HH:MM:00
+        self._listeners.append(
+            async_track_time_change(
+                self.hass,
+                time_reached,
+                hour=trigger_time.hour,
+                minute=trigger_time.minute,
+                second=0,
+            )
+        )
 
     async def _setup_event_trigger(
         self,
@@ -244,25 +323,19 @@ class TriggerManager:
         """
         _LOGGER.debug("Trigger fired: %s with data: %s", trigger_id, data)
 
+        # Callbacks are independent, so one doing I/O must not delay the rest
         callbacks = self._callbacks.get(trigger_id, [])
-        for callback in callbacks:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(data)
-                else:
-                    callback(data)
-            except Exception as err:
-                _LOGGER.error("Error in trigger callback: %s", err)
+        results = await asyncio.gather(
+            *(callback(data) for callback in callbacks),
+            return_exceptions=True,
+        )
+        for callback, result in zip(callbacks, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error in trigger callback %r: %s", callback, result)
 
     async def shutdown(self) -> None:
         """Cleanup trigger listeners."""
         for listener in self._listeners:
             listener()
         self._listeners.clear()
-
-        if self._time_task and not self._time_task.done():
-            self._time_task.cancel()
-            try:
-                await self._time_task
-            except asyncio.CancelledError:
-                pass
+        self._entity_handlers.clear()
@@ -3,9 +3,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
+import numpy as np
+import orjson
 
 from .errors import ConnectionError as WLEDConnectionError, RateLimitError
 
@@ -17,11 +21,55 @@ ENDPOINT_INFO = "/json/info"
 ENDPOINT_EFFECTS = "/json/eff"
 ENDPOINT_PALETTES = "/json/pal"
 ENDPOINT_JSON = "/json"
+ENDPOINT_WS = "/ws"
+
+# Seconds to wait before retrying a failed WebSocket connection
+WS_RETRY_INTERVAL = 30.0
+
+# Largest per-LED payload sent over WebSocket (bytes); WLED handles
+# WebSocket messages within a single TCP segment reliably, larger frames
+# go over HTTP where the device acknowledges them
+WS_MAX_PAYLOAD = 1400
 
 # Buffer size limits for per-LED control
 MAX_BUFFER_ESP8266 = 10000
 MAX_BUFFER_ESP32 = 24000
 
+# Retry backoff: base delay doubles per attempt, plus up to the same again as jitter
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 5.0
+
+# Serialized size of {"seg":[{"id":,"i":[]}]} without the id digits,
+# and of one '"RRGGBB",' list element
+_PAYLOAD_BASE_SIZE = 24
+_BYTES_PER_HEX_COLOR = 9
+
+# Window in seconds for merging queued state writes into one POST
+STATE_FLUSH_DELAY = 0.01
+
+# Minimum run of identical colors sent as a single [start, stop, color] range
+MIN_RANGE_RUN = 3
+
+# Maximum LED batch requests in flight at once; more makes ESP devices
+# answer 503 and pushes batches into the retry backoff
+MAX_CONCURRENT_BATCHES = 2
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the jittered retry delay for a failed attempt.
+
+    Random jitter spreads out retries from clients that failed together,
+    e.g. when several WLED controllers restart at once.
+
+    Args:
+        attempt: Zero-based attempt number that just failed
+
+    Returns:
+        Delay in seconds
+    """
+    delay = RETRY_BASE_DELAY * (2 ** attempt)
+    return min(RETRY_MAX_DELAY, delay + random.uniform(0, delay))
+
 
 class WLEDJsonApiClient:
     """Client for WLED JSON API with comprehensive control including per-LED operations.
@@ -36,6 +84,29 @@ class WLEDJsonApiClient:
     Properly handles buffer size limits and batching for large LED arrays.
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "base_url",
+        "_urls",
+        "_session",
+        "_owned_session",
+        "timeout",
+        "_device_info",
+        "_max_buffer",
+        "_effects",
+        "_palettes",
+        "_response_cache",
+        "_etags",
+        "_pending_state",
+        "_flush_task",
+        "_flush_now",
+        "_ws",
+        "_ws_reader",
+        "_ws_failed_at",
+        "_ws_lock",
+    )
+
     def __init__(
         self,
         host: str,
@@ -48,16 +119,45 @@ class WLEDJsonApiClient:
         Args:
             host: WLED device hostname or IP address
             port: HTTP port (default 80)
-            session: Optional aiohttp session to reuse
+            session: Optional aiohttp session to reuse (not closed by this client)
             timeout: Request timeout in seconds
         """
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
+        # Full URLs for the fixed endpoint set, built once
+        self._urls: dict[str, str] = {
+            endpoint: f"{self.base_url}{endpoint}"
+            for endpoint in (
+                ENDPOINT_STATE,
+                ENDPOINT_INFO,
+                ENDPOINT_EFFECTS,
+                ENDPOINT_PALETTES,
+                ENDPOINT_JSON,
+            )
+        }
         self._session = session
         self._owned_session = session is None
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._device_info: dict[str, Any] | None = None
+        self._max_buffer: int | None = None
+        self._effects: list[str] | None = None
+        self._palettes: list[str] | None = None
+        # Last GET response body per endpoint and its ETag
+        self._response_cache: dict[str, bytes] = {}
+        self._etags: dict[str, str] = {}
+        # Write-behind state patch merged from queued setters
+        self._pending_state: dict[str, Any] | None = None
+        # Task sending queued state, set from the first queued patch until
+        # everything queued (including during its POSTs) has been sent
+        self._flush_task: asyncio.Task | None = None
+        # Set to end the merge window early
+        self._flush_now = asyncio.Event()
+        # Persistent WebSocket for per-LED streaming (HTTP is the fallback)
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._ws_reader: asyncio.Task | None = None
+        self._ws_failed_at: float | None = None
+        self._ws_lock = asyncio.Lock()
         
         _LOGGER.debug("WLED JSON API client initialized for %s:%d", host, port)
 
@@ -70,6 +170,11 @@ class WLEDJsonApiClient:
 
     async def close(self) -> None:
         """Close the client session."""
+        try:
+            await self.flush()
+        except WLEDConnectionError as err:
+            _LOGGER.warning("Could not flush pending state for %s: %s", self.host, err)
+        await self._close_ws()
         if self._owned_session and self._session and not self._session.closed:
             try:
                 await self._session.close()
@@ -103,70 +208,118 @@ class WLEDJsonApiClient:
             WLEDConnectionError: If request fails after all retries
         """
         session = await self._ensure_session()
-        url = f"{self.base_url}{endpoint}"
-        last_error = None
-
-        for attempt in range(max_retries):
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
+        # Injected sessions are shared, so apply the per-client timeout per request
+        kwargs.setdefault("timeout", self.timeout)
+        if json_data is not None:
+            kwargs["data"] = orjson.dumps(json_data)
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Type": "application/json",
+            }
+        # Conditional GET: let the device answer 304 if nothing changed
+        is_get = method == "GET"
+        if is_get and (etag := self._etags.get(endpoint)):
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": etag}
+
+        attempt = 0
+        while True:
+            retry = attempt < max_retries - 1
             try:
-                async with session.request(
-                    method,
-                    url,
-                    json=json_data,
-                    **kwargs,
-                ) as response:
-                    # Retry on 5xx server errors
-                    if response.status >= 500 and attempt < max_retries - 1:
+                async with session.request(method, url, **kwargs) as response:
+                    # Retry on 5xx server errors (backoff happens below)
+                    if response.status >= 500 and retry:
                         _LOGGER.warning(
                             "Server error %d from %s, retrying (attempt %d/%d)",
                             response.status, endpoint, attempt + 1, max_retries
                         )
-                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    
-                    response.raise_for_status()
-                    
-                    if response.content_type == "application/json":
-                        data = await response.json()
-                        _LOGGER.debug("WLED API response from %s: %s", endpoint, data)
-                        return data
                     else:
-                        # Some endpoints may return empty response
-                        _LOGGER.debug("WLED API non-JSON response from %s", endpoint)
-                        return {}
+                        return await self._read_response(response, endpoint, is_get)
 
             except asyncio.TimeoutError as err:
-                last_error = err
-                if attempt < max_retries - 1:
-                    _LOGGER.warning(
-                        "Timeout for %s%s, retrying (attempt %d/%d)",
-                        self.base_url, endpoint, attempt + 1, max_retries
-                    )
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                _LOGGER.error("WLED API request timeout for %s%s after %d attempts", self.base_url, endpoint, max_retries)
-                raise WLEDConnectionError(
-                    f"WLED API request timeout after {max_retries} attempts: {self.base_url}{endpoint}"
-                ) from err
+                if not retry:
+                    _LOGGER.error("WLED API request timeout for %s%s after %d attempts", self.base_url, endpoint, max_retries)
+                    raise WLEDConnectionError(
+                        f"WLED API request timeout after {max_retries} attempts: {self.base_url}{endpoint}"
+                    ) from err
+                _LOGGER.warning(
+                    "Timeout for %s%s, retrying (attempt %d/%d)",
+                    self.base_url, endpoint, attempt + 1, max_retries
+                )
             
             except aiohttp.ClientError as err:
-                last_error = err
                 # Retry on connection errors but not on client errors (4xx)
-                if isinstance(err, (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError)) and attempt < max_retries - 1:
-                    _LOGGER.warning(
-                        "Connection error for %s%s: %s, retrying (attempt %d/%d)",
-                        self.base_url, endpoint, err, attempt + 1, max_retries
-                    )
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                _LOGGER.error("WLED API request failed for %s%s: %s", self.base_url, endpoint, err)
-                raise WLEDConnectionError(
-                    f"WLED API request failed: {err}"
-                ) from err
+                if not retry or not isinstance(
+                    err, (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError)
+                ):
+                    _LOGGER.error("WLED API request failed for %s%s: %s", self.base_url, endpoint, err)
+                    raise WLEDConnectionError(
+                        f"WLED API request failed: {err}"
+                    ) from err
+                _LOGGER.warning(
+                    "Connection error for %s%s: %s, retrying (attempt %d/%d)",
+                    self.base_url, endpoint, err, attempt + 1, max_retries
+                )
+
+            await asyncio.sleep(_backoff_delay(attempt))
+            attempt += 1
+
+    async def _read_response(
+        self,
+        response: aiohttp.ClientResponse,
+        endpoint: str,
+        is_get: bool,
+    ) -> dict[str, Any]:
+        """Parse a non-retried response, using the GET response cache.
+
+        Cached bodies are parsed again on every hit, so callers always get
+        their own result and may modify it freely.
+
+        Args:
+            response: Response to read
+            endpoint: API endpoint path
+            is_get: Whether the request was a GET
+
+        Returns:
+            JSON response as dict
+
+        Raises:
+            aiohttp.ClientResponseError: On 4xx/5xx status
+        """
+        cached = self._response_cache.get(endpoint) if is_get else None
+        if response.status == 304 and cached is not None:
+            _LOGGER.debug("WLED API response from %s not modified", endpoint)
+            return orjson.loads(cached) if cached else {}
+        
+        response.raise_for_status()
+        
+        if response.content_type != "application/json":
+            # Some endpoints may return empty response
+            _LOGGER.debug("WLED API non-JSON response from %s", endpoint)
+            return {}
         
-        # Should not reach here, but just in case
-        raise WLEDConnectionError(
-            f"WLED API request failed after {max_retries} attempts"
-        ) from last_error
+        body = await response.read()
+        data = orjson.loads(body) if body else {}
+        if is_get:
+            self._response_cache[endpoint] = body
+            if etag := response.headers.get("ETag"):
+                self._etags[endpoint] = etag
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("WLED API response from %s: %s", endpoint, data)
+        return data
+
+    async def verify(self) -> bool:
+        """Check that the device answers on the JSON API.
+
+        Returns:
+            True if the device state could be read
+        """
+        try:
+            await self._request("GET", ENDPOINT_STATE, max_retries=1)
+        except WLEDConnectionError as err:
+            _LOGGER.debug("JSON API verification failed for %s: %s", self.host, err)
+            return False
+        return True
 
     # ========== State Management ==========
 
@@ -194,8 +347,10 @@ class WLEDJsonApiClient:
         Returns:
             List of effect names
         """
-        data = await self._request("GET", ENDPOINT_EFFECTS)
-        return data if isinstance(data, list) else []
+        if self._effects is None:
+            data = await self._request("GET", ENDPOINT_EFFECTS)
+            self._effects = data if isinstance(data, list) else []
+        return self._effects
 
     async def get_palettes(self) -> list[str]:
         """Get list of available palettes.
@@ -203,8 +358,24 @@ class WLEDJsonApiClient:
         Returns:
             List of palette names
         """
-        data = await self._request("GET", ENDPOINT_PALETTES)
-        return data if isinstance(data, list) else []
+        if self._palettes is None:
+            data = await self._request("GET", ENDPOINT_PALETTES)
+            self._palettes = data if isinstance(data, list) else []
+        return self._palettes
+
+    async def invalidate_static_caches(self) -> None:
+        """Forget cached device info, effects, palettes and buffer size.
+
+        Call after a firmware update or reconfiguration so the next lookups
+        fetch fresh values from the device.
+        """
+        self._device_info = None
+        self._max_buffer = None
+        self._effects = None
+        self._palettes = None
+        self._response_cache.clear()
+        self._etags.clear()
+        _LOGGER.debug("Cleared static caches for %s", self.host)
 
     async def set_state(self, state: dict[str, Any], return_state: bool = False) -> dict[str, Any] | None:
         """Update device state.
@@ -237,8 +408,106 @@ class WLEDJsonApiClient:
         if return_state:
             state["v"] = True
         
+        return await self._set_state_unchecked(state)
+
+    async def _set_state_unchecked(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Post a state update without validation.
+
+        Used by internal callers whose state is already well-formed and
+        clamped, such as the per-LED frame path.
+
+        Args:
+            state: State object with values to update
+
+        Returns:
+            Response from the device
+        """
         return await self._request("POST", ENDPOINT_STATE, json_data=state)
 
+    async def queue_state(
+        self, state: dict[str, Any], delay: float = STATE_FLUSH_DELAY
+    ) -> None:
+        """Merge a state patch into the pending write and schedule a flush.
+
+        Patches queued within the delay window are sent as a single POST.
+        Patches queued while that POST is in flight are merged and sent by
+        one follow-up POST once it completes. Segment entries are merged by
+        segment id.
+
+        Args:
+            state: State object with values to update
+            delay: Seconds to wait for further patches before sending
+        """
+        pending = self._pending_state
+        if pending is None:
+            pending = self._pending_state = {}
+        
+        for key, value in state.items():
+            if key != "seg":
+                pending[key] = value
+                continue
+            segments = pending.setdefault("seg", [])
+            for seg in value:
+                for existing in segments:
+                    if existing.get("id") == seg.get("id"):
+                        existing.update(seg)
+                        break
+                else:
+                    segments.append(dict(seg))
+        
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending(delay))
+
+    async def _flush_pending(self, delay: float) -> WLEDConnectionError | None:
+        """Send the pending state after the merge window, one POST at a time.
+
+        Args:
+            delay: Seconds to wait for further patches before the first POST
+
+        Returns:
+            The error that stopped sending, or None if everything was sent
+        """
+        try:
+            if delay > 0 and not self._flush_now.is_set():
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            while self._pending_state:
+                state, self._pending_state = self._pending_state, None
+                await self._set_state_unchecked(state)
+        except WLEDConnectionError as err:
+            _LOGGER.error("Failed to send queued state to %s: %s", self.host, err)
+            return err
+        finally:
+            self._flush_now.clear()
+            self._flush_task = None
+        return None
+
+    async def flush(self, immediate: bool = True) -> None:
+        """Send pending queued state and wait until it has been delivered.
+
+        Args:
+            immediate: End the merge window now. With False the state is sent
+                when the window closes, so patches from other callers can
+                still join the same POST.
+
+        Raises:
+            WLEDConnectionError: If sending the queued state failed
+        """
+        task = self._flush_task
+        if task is None:
+            if not self._pending_state:
+                return
+            task = self._flush_task = asyncio.create_task(self._flush_pending(0))
+        elif immediate:
+            self._flush_now.set()
+        
+        # Shielded so a cancelled caller does not abort a POST others wait on
+        err = await asyncio.shield(task)
+        if err is not None:
+            raise err
+
     # ========== Power & Brightness ==========
 
     async def turn_on(self, brightness: int | None = None) -> None:
@@ -251,22 +520,28 @@ class WLEDJsonApiClient:
         if brightness is not None:
             state["bri"] = max(0, min(255, brightness))
         
-        await self.set_state(state)
+        # Queued patches were issued first, so they must reach the device first
+        await self.flush()
+        await self._set_state_unchecked(state)
         _LOGGER.debug("Turned on WLED at %s", self.host)
 
     async def turn_off(self) -> None:
         """Turn off the light."""
-        await self.set_state({"on": False})
+        await self.flush()
+        await self._set_state_unchecked({"on": False})
         _LOGGER.debug("Turned off WLED at %s", self.host)
 
     async def set_brightness(self, brightness: int) -> None:
         """Set brightness.
 
+        The write is queued and merged with other setters; call flush() to
+        send it immediately.
+
         Args:
             brightness: Brightness level (0-255)
         """
         brightness = max(0, min(255, brightness))
-        await self.set_state({"bri": brightness})
+        await self.queue_state({"bri": brightness})
         _LOGGER.debug("Set brightness to %d at %s", brightness, self.host)
 
     async def toggle(self) -> bool:
@@ -275,7 +550,8 @@ class WLEDJsonApiClient:
         Returns:
             New state (True = on, False = off)
         """
-        result = await self.set_state({"on": "t", "v": True})
+        await self.flush()
+        result = await self._set_state_unchecked({"on": "t", "v": True})
         return result.get("on", False) if result else False
 
     # ========== Segment Control ==========
@@ -291,8 +567,10 @@ class WLEDJsonApiClient:
             segment_id: Segment ID (0-based)
             **kwargs: Segment properties to update (col, fx, sx, ix, pal, etc.)
         """
+        # Queued patches were issued first, so they must reach the device first
+        await self.flush()
         segment_data = {"id": segment_id, **kwargs}
-        await self.set_state({"seg": [segment_data]})
+        await self._set_state_unchecked({"seg": [segment_data]})
         _LOGGER.debug("Updated segment %d at %s: %s", segment_id, self.host, kwargs)
 
     async def set_segment_color(
@@ -304,6 +582,9 @@ class WLEDJsonApiClient:
     ) -> None:
         """Set segment colors.
 
+        The write is queued and merged with other setters; call flush() to
+        send it immediately.
+
         Args:
             segment_id: Segment ID
             primary: Primary RGB color
@@ -320,7 +601,7 @@ class WLEDJsonApiClient:
             colors.append(list(tertiary))
         
         if colors:
-            await self.update_segment(segment_id, col=colors)
+            await self.queue_state({"seg": [{"id": segment_id, "col": colors}]})
 
     async def set_segment_effect(
         self,
@@ -332,6 +613,9 @@ class WLEDJsonApiClient:
     ) -> None:
         """Set segment effect and parameters.
 
+        The write is queued and merged with other setters; call flush() to
+        send it immediately.
+
         Args:
             segment_id: Segment ID
             effect_id: Effect ID
@@ -348,7 +632,7 @@ class WLEDJsonApiClient:
         if palette_id is not None:
             params["pal"] = palette_id
         
-        await self.update_segment(segment_id, **params)
+        await self.queue_state({"seg": [{"id": segment_id, **params}]})
 
     # ========== Per-LED Control ==========
 
@@ -363,32 +647,87 @@ class WLEDJsonApiClient:
         """
         return f"{color[0]:02X}{color[1]:02X}{color[2]:02X}"
 
-    def _estimate_buffer_size(self, led_data: list[Any]) -> int:
-        """Estimate JSON buffer size for LED data.
+    def _colors_to_hex(self, colors: Any) -> list[str]:
+        """Convert many RGB colors to hex strings in one pass.
+
+        The colors are packed into one contiguous byte buffer and hex-encoded
+        in a single call, then split into 6-character strings.
 
         Args:
-            led_data: LED data array
+            colors: List of RGB tuples or an (N, 3) array
 
         Returns:
-            Estimated buffer size in bytes
+            List of hex strings like "FF00AA"
         """
-        # Simple estimation without JSON serialization (faster, no event loop blocking)
-        # Base JSON structure: {"seg":{"i":[...]}}
-        base_overhead = 20  # bytes for JSON structure
-        
-        # Each hex color string: "FF00AA" (6 chars) + quotes + comma = ~10 bytes
-        # Each index: 1-4 digits + comma = ~5 bytes average
-        bytes_per_element = 10
-        
-        estimated = base_overhead + (len(led_data) * bytes_per_element)
-        # Add 20% safety margin
-        return int(estimated * 1.2)
+        arr = np.asarray(colors)[:, :3]
+        if arr.dtype != np.uint8:
+            arr = np.clip(arr, 0, 255).astype(np.uint8)
+        hex_str = arr.tobytes().hex().upper()
+        return [hex_str[i:i + 6] for i in range(0, len(hex_str), 6)]
+
+    def _payload_size(self, segment_id: int, led_count: int, start_index: int | None) -> int:
+        """Compute the exact serialized size of a per-LED segment update.
+
+        The payload is {"seg":[{"id":N,"i":[start,"RRGGBB",...]}]} as
+        serialized compactly by orjson, so every hex color costs exactly
+        9 bytes ("RRGGBB" plus quotes and comma).
+
+        Args:
+            segment_id: Segment ID
+            led_count: Number of hex colors in the payload
+            start_index: Leading start index, or None if omitted
+
+        Returns:
+            Payload size in bytes
+        """
+        size = _PAYLOAD_BASE_SIZE + len(str(segment_id))
+        if led_count:
+            size += _BYTES_PER_HEX_COLOR * led_count - 1
+        if start_index is not None:
+            size += len(str(start_index)) + 1
+        return size
+
+    def _encode_runs(self, hex_colors: list[str], start_index: int = 0) -> list[str | int]:
+        """Encode LED colors as a WLED "i" array with range runs.
+
+        Runs of MIN_RANGE_RUN or more identical colors become a
+        [start, stop, "RRGGBB"] range (stop exclusive, as WLED expects).
+        Other colors are listed individually, preceded by their start index
+        whenever they do not directly follow the implicit position.
+
+        Args:
+            hex_colors: List of hex color strings
+            start_index: LED index of the first color
+
+        Returns:
+            LED data array for the segment "i" field
+        """
+        led_data: list[str | int] = []
+        need_index = start_index > 0
+        total = len(hex_colors)
+        i = 0
+        while i < total:
+            color = hex_colors[i]
+            j = i + 1
+            while j < total and hex_colors[j] == color:
+                j += 1
+            if j - i >= MIN_RANGE_RUN:
+                led_data += (start_index + i, start_index + j, color)
+                need_index = True
+            else:
+                if need_index:
+                    led_data.append(start_index + i)
+                    need_index = False
+                led_data += hex_colors[i:j]
+            i = j
+        return led_data
 
     async def set_individual_leds(
         self,
         segment_id: int,
         colors: list[tuple[int, int, int]],
         start_index: int = 0,
+        ordered: bool = False,
     ) -> None:
         """Set individual LED colors in a segment.
 
@@ -397,42 +736,49 @@ class WLEDJsonApiClient:
 
         Args:
             segment_id: Segment ID
-            colors: List of RGB tuples
+            colors: List of RGB tuples or an (N, 3) uint8 array
             start_index: Starting LED index in segment (default 0)
+            ordered: Send batches one after another instead of concurrently
         """
-        if not colors:
+        if len(colors) == 0:
             return
 
+        # Queued patches were issued first, so they must reach the device first
+        await self.flush()
+
         # Convert colors to hex strings (more efficient than RGB arrays)
-        hex_colors = [self._color_to_hex(c) for c in colors]
+        hex_colors = self._colors_to_hex(colors)
         
-        # Build LED data array with start index
-        led_data: list[str | int] = []
-        if start_index > 0:
-            led_data.extend([start_index])
-        led_data.extend(hex_colors)
+        # Build LED data array, collapsing runs of identical colors into ranges
+        led_data = self._encode_runs(hex_colors, start_index)
         
         # Check buffer size and batch if necessary
-        estimated_size = self._estimate_buffer_size(led_data)
+        payload_size = _PAYLOAD_BASE_SIZE + len(str(segment_id)) - 1 + sum(
+            _BYTES_PER_HEX_COLOR if isinstance(item, str) else len(str(item)) + 1
+            for item in led_data
+        )
         # Get device-specific buffer size
-        max_buffer = await self.get_max_buffer_size()
+        max_buffer = self._max_buffer or await self.get_max_buffer_size()
         
-        if estimated_size > max_buffer:
+        if payload_size > max_buffer:
             # Need to batch
             _LOGGER.debug(
-                "Batching LED data: estimated %d bytes > %d limit",
-                estimated_size,
+                "Batching LED data: %d bytes > %d limit",
+                payload_size,
                 max_buffer,
             )
-            await self._set_leds_batched(segment_id, hex_colors, start_index, max_buffer)
+            await self._set_leds_batched(
+                segment_id, hex_colors, start_index, max_buffer, ordered
+            )
         else:
             # Single call
-            await self.update_segment(segment_id, i=led_data)
+            await self._send_leds(segment_id, led_data)
             _LOGGER.debug(
-                "Set %d LEDs on segment %d at %s (single call)",
+                "Set %d LEDs on segment %d at %s (single call, %d items)",
                 len(colors),
                 segment_id,
                 self.host,
+                len(led_data),
             )
 
     async def _set_leds_batched(
@@ -441,48 +787,59 @@ class WLEDJsonApiClient:
         hex_colors: list[str],
         start_index: int = 0,
         max_buffer: int = MAX_BUFFER_ESP32,
+        ordered: bool = False,
     ) -> None:
         """Set LEDs in batches to respect buffer limits.
 
+        Batches cover disjoint LED ranges, so by default up to
+        MAX_CONCURRENT_BATCHES are sent concurrently. Transient device errors
+        are retried with backoff by _request.
+
         Args:
             segment_id: Segment ID
             hex_colors: List of hex color strings
             start_index: Starting LED index
             max_buffer: Maximum buffer size for device
+            ordered: Send batches sequentially in LED order
         """
-        # Calculate optimal batch size based on buffer (10 bytes per LED + 20 byte overhead)
-        bytes_per_led = 10
-        batch_size = max(1, int((max_buffer * 0.8 - 20) / bytes_per_led))  # 80% of buffer for safety
-        
         total_leds = len(hex_colors)
+        # Largest batch whose exact payload fits, sized for the widest start index
+        overhead = self._payload_size(segment_id, 0, start_index + total_leds) - 1
+        batch_size = max(1, (max_buffer - overhead) // _BYTES_PER_HEX_COLOR)
+        
         total_batches = (total_leds + batch_size - 1) // batch_size
         
         _LOGGER.debug(
-            "Batching %d LEDs into %d batches of ~%d LEDs (max_buffer=%d)",
-            total_leds, total_batches, batch_size, max_buffer
+            "Batching %d LEDs into %d batches of ~%d LEDs (max_buffer=%d, ordered=%s)",
+            total_leds, total_batches, batch_size, max_buffer, ordered
         )
         
-        for i in range(0, total_leds, batch_size):
-            batch = hex_colors[i:i + batch_size]
+        semaphore = asyncio.Semaphore(1 if ordered else MAX_CONCURRENT_BATCHES)
+
+        async def send_batch(i: int) -> None:
             batch_start = start_index + i
             
-            # Build LED data for this batch
-            led_data: list[str | int] = [batch_start]
-            led_data.extend(batch)
+            # Build LED data for this batch in one allocation
+            led_data: list[str | int] = [batch_start, *hex_colors[i:i + batch_size]]
             
-            await self.update_segment(segment_id, i=led_data)
+            async with semaphore:
+                await self._send_leds(segment_id, led_data)
             _LOGGER.debug(
                 "Set LEDs %d-%d on segment %d (batch %d/%d)",
                 batch_start,
-                batch_start + len(batch) - 1,
+                batch_start + len(led_data) - 2,
                 segment_id,
                 i // batch_size + 1,
                 total_batches,
             )
-            
-            # Small delay between batches to avoid overwhelming device (50ms)
-            if i + batch_size < total_leds:
-                await asyncio.sleep(0.05)
+
+        if ordered:
+            for i in range(0, total_leds, batch_size):
+                await send_batch(i)
+        else:
+            await asyncio.gather(
+                *(send_batch(i) for i in range(0, total_leds, batch_size))
+            )
 
     async def set_led(
         self,
@@ -563,22 +920,110 @@ class WLEDJsonApiClient:
             self.host,
         )
 
+    async def _send_leds(self, segment_id: int, led_data: list[str | int]) -> None:
+        """Send a per-LED segment update, over WebSocket when available.
+
+        WebSocket messages are not acknowledged, so a frame the device drops
+        is lost without an error. That is only acceptable for small
+        streaming frames, which the next frame supersedes; payloads above
+        WS_MAX_PAYLOAD always use HTTP.
+
+        Args:
+            segment_id: Segment ID
+            led_data: LED data array for the segment "i" field
+        """
+        payload = orjson.dumps({"seg": [{"id": segment_id, "i": led_data}]})
+        ws = await self._get_ws() if len(payload) <= WS_MAX_PAYLOAD else None
+        if ws is not None:
+            try:
+                # WLED only parses JSON state from text frames
+                await ws.send_str(payload.decode())
+                return
+            except (aiohttp.ClientError, ConnectionResetError) as err:
+                _LOGGER.debug("WebSocket send to %s failed, using HTTP: %s", self.host, err)
+                self._ws_failed_at = time.monotonic()
+                await self._close_ws()
+        
+        await self.update_segment(segment_id, i=led_data)
+
+    async def _get_ws(self) -> aiohttp.ClientWebSocketResponse | None:
+        """Return the open WebSocket, connecting lazily.
+
+        After a failed connection, HTTP is used for WS_RETRY_INTERVAL seconds
+        before connecting again.
+
+        Returns:
+            WebSocket connection, or None to use HTTP
+        """
+        if self._ws is not None and not self._ws.closed:
+            return self._ws
+        
+        # Concurrent batches share one connection attempt
+        async with self._ws_lock:
+            if self._ws is not None and not self._ws.closed:
+                return self._ws
+            if (
+                self._ws_failed_at is not None
+                and time.monotonic() - self._ws_failed_at < WS_RETRY_INTERVAL
+            ):
+                return None
+            
+            session = await self._ensure_session()
+            try:
+                self._ws = await session.ws_connect(
+                    f"ws://{self.host}:{self.port}{ENDPOINT_WS}",
+                    timeout=aiohttp.ClientWSTimeout(ws_close=self.timeout.total),
+                    heartbeat=30,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("WebSocket unavailable for %s, using HTTP: %s", self.host, err)
+                self._ws_failed_at = time.monotonic()
+                self._ws = None
+                return None
+            
+            self._ws_failed_at = None
+            self._ws_reader = asyncio.create_task(self._drain_ws(self._ws))
+            _LOGGER.debug("WebSocket connected to %s", self.host)
+            return self._ws
+
+    async def _drain_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Discard state pushes so the WebSocket receive buffer never fills."""
+        async for _msg in ws:
+            pass
+
+    async def _close_ws(self) -> None:
+        """Close the WebSocket and its reader task."""
+        if self._ws_reader is not None:
+            self._ws_reader.cancel()
+            self._ws_reader = None
+        if self._ws is not None:
+            ws, self._ws = self._ws, None
+            try:
+                await ws.close()
+            except Exception as err:
+                _LOGGER.debug("Error closing WebSocket for %s: %s", self.host, err)
+
     # ========== Utility Methods ==========
 
     async def get_max_buffer_size(self) -> int:
         """Get maximum buffer size based on device architecture.
 
+        The result is memoized once the architecture is known.
+
         Returns:
             Maximum buffer size in bytes
         """
+        if self._max_buffer is not None:
+            return self._max_buffer
         try:
             info = await self.get_info()
             arch = info.get("arch", "").lower()
             
             if "esp32" in arch:
-                return MAX_BUFFER_ESP32
+                self._max_buffer = MAX_BUFFER_ESP32
             else:
-                return MAX_BUFFER_ESP8266
+                self._max_buffer = MAX_BUFFER_ESP8266
+            return self._max_buffer
         except (WLEDConnectionError, KeyError, AttributeError) as err:
             _LOGGER.warning("Could not determine device architecture: %s, using conservative default", err)
             return MAX_BUFFER_ESP8266  # Conservative default
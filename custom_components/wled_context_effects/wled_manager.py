@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from wled import WLED
 
 from .errors import ConnectionError as WLEDConnectionError
@@ -12,7 +15,6 @@ from .wled_json_api import WLEDJsonApiClient
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
-    import aiohttp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,8 +37,9 @@ class WLEDConnectionManager:
             hass: Home Assistant instance
         """
         self.hass = hass
-        self._clients: dict[str, WLED] = {}
-        self._json_clients: dict[str, WLEDJsonApiClient] = {}
+        # Least recently used clients first
+        self._clients: OrderedDict[str, WLED] = OrderedDict()
+        self._json_clients: OrderedDict[str, WLEDJsonApiClient] = OrderedDict()
         _LOGGER.debug("WLED connection manager initialized")
 
     async def get_client(self, host: str) -> WLED:
@@ -53,23 +56,21 @@ class WLEDConnectionManager:
         """
         if host in self._clients:
             _LOGGER.debug("Reusing existing WLED client for %s", host)
-            # Move to end (LRU)
-            client = self._clients.pop(host)
-            self._clients[host] = client
-            return client
+            self._clients.move_to_end(host)
+            return self._clients[host]
 
-        # Check if at capacity and evict oldest
-        total_clients = len(self._clients) + len(self._json_clients)
-        if total_clients >= MAX_CACHED_CLIENTS:
-            # Evict oldest python-wled client
-            if self._clients:
-                oldest_host = next(iter(self._clients))
-                _LOGGER.info("Client cache full (%d), evicting oldest: %s", MAX_CACHED_CLIENTS, oldest_host)
-                await self.close_client(oldest_host)
+        # Evict oldest python-wled clients until under capacity
+        while self._clients and self.client_count >= MAX_CACHED_CLIENTS:
+            oldest_host, oldest = self._clients.popitem(last=False)
+            _LOGGER.info("Client cache full (%d), evicting oldest: %s", MAX_CACHED_CLIENTS, oldest_host)
+            try:
+                await oldest.close()
+            except Exception as err:
+                _LOGGER.error("Error closing WLED client for %s: %s", oldest_host, err)
 
         try:
             _LOGGER.info("Creating new WLED client for %s", host)
-            client = WLED(host)
+            client = WLED(host, session=self._get_session())
 
             # Test connection with timeout
             try:
@@ -91,6 +92,17 @@ class WLEDConnectionManager:
                 f"Failed to connect to WLED device at {host}: {err}"
             ) from err
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get Home Assistant's shared aiohttp session.
+
+        Home Assistant owns and closes this session, so clients built on it
+        reuse its keep-alive connections and must never close it.
+
+        Returns:
+            Shared aiohttp session
+        """
+        return async_get_clientsession(self.hass)
+
     async def test_connection(self, host: str) -> bool:
         """Test connection to a WLED device.
 
@@ -101,9 +113,10 @@ class WLEDConnectionManager:
             True if connection successful
         """
         try:
-            client = WLED(host)
+            # Probe over the shared session; the client does not own it, so
+            # there is nothing to close afterwards
+            client = WLED(host, session=self._get_session())
             await client.update()
-            await client.close()
             return True
         except Exception as err:
             _LOGGER.debug("Connection test failed for %s: %s", host, err)
@@ -120,56 +133,39 @@ class WLEDConnectionManager:
         Args:
             host: WLED device hostname or IP address
             port: HTTP port (default 80)
-            session: Optional aiohttp session to reuse
+            session: Optional aiohttp session to reuse (defaults to Home
+                Assistant's shared session)
 
         Returns:
             WLEDJsonApiClient instance
-
-        Raises:
-            WLEDConnectionError: If connection cannot be established
         """
         client_key = f"{host}:{port}"
         
         if client_key in self._json_clients:
             _LOGGER.debug("Reusing existing JSON API client for %s", client_key)
-            # Move to end (LRU)
-            client = self._json_clients.pop(client_key)
-            self._json_clients[client_key] = client
-            return client
-
-        # Check if at capacity and evict oldest
-        total_clients = len(self._clients) + len(self._json_clients)
-        if total_clients >= MAX_CACHED_CLIENTS:
-            # Evict oldest JSON API client
-            if self._json_clients:
-                oldest_key = next(iter(self._json_clients))
-                _LOGGER.info("Client cache full (%d), evicting oldest: %s", MAX_CACHED_CLIENTS, oldest_key)
-                parts = oldest_key.split(":")
-                await self.close_json_client(parts[0], int(parts[1]) if len(parts) > 1 else 80)
+            self._json_clients.move_to_end(client_key)
+            return self._json_clients[client_key]
 
-        try:
-            _LOGGER.info("Creating new JSON API client for %s", client_key)
-            client = WLEDJsonApiClient(host, port, session)
-
-            # Test connection with timeout
+        # Evict oldest JSON API clients until under capacity
+        while self._json_clients and self.client_count >= MAX_CACHED_CLIENTS:
+            oldest_key, oldest = self._json_clients.popitem(last=False)
+            _LOGGER.info("Client cache full (%d), evicting oldest: %s", MAX_CACHED_CLIENTS, oldest_key)
             try:
-                await asyncio.wait_for(client.get_state(), timeout=10.0)
-            except asyncio.TimeoutError:
-                await client.close()
-                raise WLEDConnectionError(
-                    f"Connection timeout for WLED device at {client_key}"
-                )
-
-            self._json_clients[client_key] = client
-            return client
-
-        except WLEDConnectionError:
-            raise
-        except (OSError, asyncio.TimeoutError, ValueError) as err:
-            _LOGGER.error("Failed to connect to WLED device at %s: %s", client_key, err)
-            raise WLEDConnectionError(
-                f"Failed to connect to WLED device at {client_key}: {err}"
-            ) from err
+                await oldest.close()
+            except Exception as err:
+                _LOGGER.error("Error closing JSON API client for %s: %s", oldest_key, err)
+
+        # No reachability probe: the first real request opens the pooled
+        # connection and surfaces failures through the client's retry path.
+        # Use WLEDJsonApiClient.verify() where strict validation is needed.
+        _LOGGER.info("Creating new JSON API client for %s", client_key)
+        # Build on the HA-managed session so all clients share its keep-alive
+        # connections; the client never closes a session it was given
+        if session is None:
+            session = self._get_session()
+        client = WLEDJsonApiClient(host, port, session)
+        self._json_clients[client_key] = client
+        return client
 
     async def close_json_client(self, host: str, port: int = 80) -> None:
         """Close and remove a specific JSON API client.
@@ -209,19 +205,16 @@ class WLEDConnectionManager:
         total_clients = len(self._clients) + len(self._json_clients)
         _LOGGER.info("Closing all WLED connections (%d clients)", total_clients)
 
-        # Close python-wled clients
-        for host, client in list(self._clients.items()):
-            try:
-                await client.close()
-            except Exception as err:
-                _LOGGER.error("Error closing WLED client for %s: %s", host, err)
-
-        # Close JSON API clients
-        for client_key, client in list(self._json_clients.items()):
-            try:
-                await client.close()
-            except Exception as err:
-                _LOGGER.error("Error closing JSON API client for %s: %s", client_key, err)
+        # Close python-wled and JSON API clients concurrently
+        names = [*self._clients, *self._json_clients]
+        results = await asyncio.gather(
+            *(client.close() for client in self._clients.values()),
+            *(client.close() for client in self._json_clients.values()),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error closing WLED client for %s: %s", name, result)
 
         self._clients.clear()
         self._json_clients.clear()